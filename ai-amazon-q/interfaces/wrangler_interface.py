@@ -8,7 +8,7 @@ normalizing and preprocessing raw subtitle data before it is passed to the
 alignment component.
 """
 
-from typing import list, Any, Optional, Union, tuple
+from typing import Any, Optional, Union
 import json
 from pathlib import Path
 
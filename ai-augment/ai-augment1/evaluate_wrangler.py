@@ -13,7 +13,7 @@ import time
 import argparse
 import importlib.util
 from pathlib import Path
-from typing import dict, Any, list, Optional, tuple
+from typing import Any, Optional
 import traceback
 
 
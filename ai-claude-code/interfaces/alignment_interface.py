@@ -7,7 +7,7 @@ subtitle alignment competition. The Sync Showdown is responsible for
 implementing the Phonetic Walk algorithm to align two sets of subtitles.
 """
 
-from typing import list, dict, Any, Optional, Union, tuple
+from typing import Any, Optional, Union
 import json
 from pathlib import Path
 
@@ -0,0 +1,201 @@
+
+"""
+Shared Alignment Result and Configuration Types
+
+This module is the single canonical home of the AlignmentResult and
+AlignmentConfig classes used by "The Sync Showdown" component. Both the
+interface definition and competitor solutions import from here, so every
+import path shares one class object (isinstance checks agree across modules)
+and the class-creation cost is paid once at import time.
+"""
+
+from dataclasses import asdict, dataclass, field
+from typing import Any, Optional
+
+
+@dataclass(slots=True)
+class AlignmentResult:
+    """
+    Class representing the result of an alignment operation.
+
+    Slotted so each instance stores its five fields in fixed slots instead of
+    a per-instance __dict__, cutting memory and attribute-lookup cost when an
+    evaluation run constructs thousands of results.
+
+    Attributes:
+        status: 'success' or 'failure'
+        offset_seconds: The calculated time offset in seconds (if successful)
+        confidence: A confidence score between 0.0 and 1.0 (if successful)
+        alignment_path: The alignment path as a list of (i, j) index pairs (if successful)
+        reason: The reason for failure (if status is 'failure')
+    """
+
+    status: str
+    offset_seconds: float | None = None
+    confidence: float | None = None
+    alignment_path: Optional[list[tuple[int, int]]] = None
+    reason: str | None = None
+    # Memoized to_dict form; results are conceptually immutable once built
+    # by success()/failure(), so the first conversion can be reused
+    # (functools.cached_property needs __dict__, which slots removes)
+    _dict_cache: dict[str, Any] | None = field(
+        default=None, repr=False, compare=False
+    )
+
+    def is_success(self) -> bool:
+        """
+        Check if the alignment was successful.
+
+        Returns:
+            True if the alignment was successful, False otherwise
+        """
+        return self.status == 'success'
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the result to a dictionary.
+
+        Returns:
+            A dictionary representation of the alignment result
+        """
+        result = self._dict_cache
+        if result is not None:
+            return result
+
+        result = {'status': self.status}
+
+        if self.is_success():
+            result.update({
+                'offset_seconds': self.offset_seconds,
+                'confidence': self.confidence
+            })
+            if self.alignment_path:
+                result['alignment_path'] = self.alignment_path
+        else:
+            result['reason'] = self.reason
+            result['offset_seconds'] = None
+
+        self._dict_cache = result
+        return result
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'AlignmentResult':
+        """
+        Create an AlignmentResult from a dictionary.
+
+        Args:
+            data: dictionary containing alignment result data
+
+        Returns:
+            An AlignmentResult instance
+        """
+        if data['status'] == 'success':
+            return cls(
+                status='success',
+                offset_seconds=data.get('offset_seconds'),
+                confidence=data.get('confidence'),
+                alignment_path=data.get('alignment_path')
+            )
+        else:
+            return cls(
+                status='failure',
+                reason=data.get('reason')
+            )
+
+    @classmethod
+    def success(
+        cls,
+        offset_seconds: float,
+        confidence: float,
+        alignment_path: Optional[list[tuple[int, int]]] = None
+    ) -> 'AlignmentResult':
+        """
+        Create a successful alignment result.
+
+        Args:
+            offset_seconds: The calculated time offset in seconds
+            confidence: A confidence score between 0.0 and 1.0
+            alignment_path: The alignment path as a list of (i, j) index pairs
+
+        Returns:
+            A successful AlignmentResult
+        """
+        return cls(
+            status='success',
+            offset_seconds=offset_seconds,
+            confidence=confidence,
+            alignment_path=alignment_path
+        )
+
+    @classmethod
+    def failure(cls, reason: str) -> 'AlignmentResult':
+        """
+        Create a failed alignment result.
+
+        Args:
+            reason: The reason for failure
+
+        Returns:
+            A failed AlignmentResult
+        """
+        return cls(
+            status='failure',
+            reason=reason
+        )
+
+
+@dataclass(slots=True)
+class AlignmentConfig:
+    """
+    Configuration parameters for the alignment algorithm.
+
+    Attributes:
+        phonetic_similarity_threshold: Minimum similarity score for direct matches
+        smear_similarity_threshold: Minimum similarity score for smear matches
+        initial_search_window_seconds: Max time difference for initial search
+        local_search_neighborhood: Relative indices to check for next match
+        min_path_length: Minimum number of match points required
+        max_consecutive_gaps: Maximum number of consecutive skipped chunks
+        gap_penalty: Penalty applied to path score for each skipped chunk
+        speaker_mismatch_penalty: Penalty for speaker mismatches
+        offset_consistency_threshold_sd: Max standard deviation for offsets
+        phonetic_groups: Phoneme grouping for substitution costs; None uses
+            the default articulatory groups
+    """
+
+    phonetic_similarity_threshold: float = 0.7
+    smear_similarity_threshold: float = 0.5
+    initial_search_window_seconds: float = 120.0
+    local_search_neighborhood: dict[str, list[int]] | None = None
+    min_path_length: int = 5
+    max_consecutive_gaps: int = 2
+    gap_penalty: float = 0.1
+    speaker_mismatch_penalty: float = 0.5
+    offset_consistency_threshold_sd: float = 0.5
+    phonetic_groups: dict[str, tuple[str, ...]] | None = None
+
+    def __post_init__(self):
+        if self.local_search_neighborhood is None:
+            self.local_search_neighborhood = {'i_steps': [1, 2], 'j_steps': [1, 2]}
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the configuration to a dictionary.
+
+        Returns:
+            A dictionary representation of the configuration
+        """
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'AlignmentConfig':
+        """
+        Create an AlignmentConfig from a dictionary.
+
+        Args:
+            data: dictionary containing configuration parameters
+
+        Returns:
+            An AlignmentConfig instance
+        """
+        return cls(**data)
@@ -5,68 +5,9 @@ This module implements the align_subtitles function for The Sync Showdown
 component of the subtitle alignment competition.
 """
 
-from typing import dict, Any, list, Optional, tuple
+from typing import Any, Optional
 
-
-class AlignmentResult:
-    """
-    Class representing the result of an alignment operation.
-    """
-
-    def __init__(
-        self,
-        status: str,
-        offset_seconds: float | None = None,
-        confidence: float | None = None,
-        alignment_path: Optional[list[tuple[int, int]]] = None,
-        reason: str | None = None
-    ):
-        """
-        Initialize an AlignmentResult.
-
-        Args:
-            status: 'success' or 'failure'
-            offset_seconds: The calculated time offset in seconds (if successful)
-            confidence: A confidence score between 0.0 and 1.0 (if successful)
-            alignment_path: The alignment path as a list of (i, j) index pairs (if successful)
-            reason: The reason for failure (if status is 'failure')
-        """
-        self.status = status
-        self.offset_seconds = offset_seconds
-        self.confidence = confidence
-        self.alignment_path = alignment_path
-        self.reason = reason
-
-
-class AlignmentConfig:
-    """
-    Configuration parameters for the alignment algorithm.
-    """
-
-    def __init__(
-        self,
-        phonetic_similarity_threshold: float = 0.7,
-        smear_similarity_threshold: float = 0.5,
-        initial_search_window_seconds: float = 120.0,
-        local_search_neighborhood: dict[str, list[int]] = None,
-        min_path_length: int = 5,
-        max_consecutive_gaps: int = 2,
-        gap_penalty: float = 0.1,
-        speaker_mismatch_penalty: float = 0.5,
-        offset_consistency_threshold_sd: float = 0.5
-    ):
-        """
-        Initialize alignment configuration parameters.
-        """
-        self.phonetic_similarity_threshold = phonetic_similarity_threshold
-        self.smear_similarity_threshold = smear_similarity_threshold
-        self.initial_search_window_seconds = initial_search_window_seconds
-        self.local_search_neighborhood = local_search_neighborhood or {'i_steps': [1, 2], 'j_steps': [1, 2]}
-        self.min_path_length = min_path_length
-        self.max_consecutive_gaps = max_consecutive_gaps
-        self.gap_penalty = gap_penalty
-        self.speaker_mismatch_penalty = speaker_mismatch_penalty
-        self.offset_consistency_threshold_sd = offset_consistency_threshold_sd
+from interfaces.alignment_types import AlignmentConfig, AlignmentResult
 
 
 def align_subtitles(
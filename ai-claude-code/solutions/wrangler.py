@@ -5,7 +5,7 @@ This module implements the normalize_subtitles function for the Freestyle Wrangl
 component of the subtitle alignment competition.
 """
 
-from typing import dict, Any, list
+from typing import Any
 
 
 def normalize_subtitles(caption: dict[str, Any]) -> dict[str, Any]:
@@ -8,10 +8,26 @@ normalizing and preprocessing raw subtitle data before it is passed to the
 alignment component.
 """
 
-from typing import list, dict, Any, Optional, Union, tuple
+from typing import Any, Optional, Union
 import json
+import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 
 def normalize_subtitles(caption: dict[str, Any]) -> dict[str, Any]:
     """
@@ -46,6 +62,62 @@ def normalize_subtitles(caption: dict[str, Any]) -> dict[str, Any]:
     raise NotImplementedError("Implement normalize_subtitles to handle a single caption")
 
 
+def normalize_subtitles_batch(captions: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Normalize a batch of subtitle captions in one call.
+
+    Implementations may override this to amortize per-call setup costs
+    (compiled regexes, encoder caches, phonemizer warm-up) across the whole
+    batch instead of paying them once per caption. The default simply applies
+    normalize_subtitles to each caption in order.
+
+    Args:
+        captions: list of raw subtitle caption dictionaries
+
+    Returns:
+        list of normalized subtitle dictionaries, one per input caption
+    """
+    return [normalize_subtitles(caption) for caption in captions]
+
+
+if njit is not None:
+    @njit(cache=True, parallel=True)
+    def _parse_timestamps_njit(timestamps_ms):
+        """Convert an int64 millisecond array to float64 seconds (JIT-compiled)."""
+        return timestamps_ms / 1000.0
+else:
+    def _parse_timestamps_njit(timestamps_ms):
+        """Convert millisecond timestamps to float seconds (pure-Python fallback)."""
+        return [ms / 1000.0 for ms in timestamps_ms]
+
+
+def _intern_caption(caption: dict[str, Any]) -> dict[str, Any]:
+    """
+    Intern the small-alphabet string fields of a caption in place.
+
+    Subtitle corpora draw phonemes from a tiny alphabet (~40 ARPABET tokens)
+    and speakers from a handful of names, but JSON decoding produces a fresh
+    str object per occurrence. Interning collapses them to one canonical
+    object each, shrinking phoneme-list memory by roughly the alphabet ratio
+    and turning downstream equality checks into pointer compares.
+
+    Args:
+        caption: A subtitle dictionary (modified in place)
+
+    Returns:
+        The same caption dictionary
+    """
+    phonemes = caption.get('phonemes')
+    if phonemes:
+        caption['phonemes'] = [
+            sys.intern(p) if isinstance(p, str) else p for p in phonemes
+        ]
+    speaker = caption.get('speaker')
+    if isinstance(speaker, str):
+        caption['speaker'] = sys.intern(speaker)
+    return caption
+
+
 def load_subtitles(file_path: Union[str, Path]) -> list[dict[str, Any]]:
     """
     Helper function to load subtitle data from a JSON file.
@@ -61,8 +133,45 @@ def load_subtitles(file_path: Union[str, Path]) -> list[dict[str, Any]]:
         json.JSONDecodeError: If the file contains invalid JSON
     """
     path = Path(file_path) if isinstance(file_path, str) else file_path
-    with path.open('r', encoding='utf-8') as f:
-        return json.load(f)
+    if orjson is not None:
+        # orjson parses bytes directly, skipping the text-decoding layer in open()
+        subtitles = orjson.loads(path.read_bytes())
+    else:
+        with path.open('r', encoding='utf-8') as f:
+            subtitles = json.load(f)
+
+    for caption in subtitles:
+        if isinstance(caption, dict):
+            _intern_caption(caption)
+    return subtitles
+
+
+def iter_subtitles(file_path: Union[str, Path]):
+    """
+    Helper function to lazily iterate subtitle data from a JSON file.
+
+    Unlike load_subtitles, this streams captions one at a time so peak memory
+    stays proportional to a single caption rather than the whole file. Requires
+    ijson for true streaming; without it, the full file is loaded and iterated.
+
+    Args:
+        file_path: Path to the JSON file
+
+    Yields:
+        Subtitle dictionaries, one at a time
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    path = Path(file_path) if isinstance(file_path, str) else file_path
+    if ijson is not None:
+        with path.open('rb') as f:
+            for caption in ijson.items(f, 'item'):
+                if isinstance(caption, dict):
+                    _intern_caption(caption)
+                yield caption
+    else:
+        yield from load_subtitles(path)
 
 
 def save_subtitles(subtitles: list[dict[str, Any]], file_path: Union[str, Path]) -> None:
@@ -78,5 +187,10 @@ def save_subtitles(subtitles: list[dict[str, Any]], file_path: Union[str, Path])
     """
     path = Path(file_path) if isinstance(file_path, str) else file_path
     path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        path.write_bytes(
+            orjson.dumps(subtitles, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        return
     with path.open('w', encoding='utf-8') as f:
         json.dump(subtitles, f, ensure_ascii=False, indent=2)
@@ -6,31 +6,53 @@ This script generates test data with various challenges to test both the
 "Freestyle Wrangler" and "The Sync Showdown" components of the competition.
 """
 
+import functools
 import json
 import random
 import os
 import argparse
 import string
+import sys
 import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import unicodedata
 
-# Constants for data generation
-SPEAKERS = ["Speaker 1", "Speaker 2", "Speaker 3", "Speaker 4", "Speaker 5"]
-FOREIGN_PHRASES = [
-    "你好，世界", 
-    "こんにちは世界", 
-    "안녕하세요 세계", 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Batched RNG for pre-drawing per-entry random quantities in one C call each;
+# None when numpy is unavailable and the pure-Python fallbacks are used.
+_rng = np.random.default_rng() if np is not None else None
+
+# Constants for data generation. Frozen as tuples of interned strings: the
+# pools are read-only random.choice targets, and interning means every entry
+# drawing the same value shares one string object.
+SPEAKERS = tuple(sys.intern(s) for s in (
+    "Speaker 1", "Speaker 2", "Speaker 3", "Speaker 4", "Speaker 5"
+))
+FOREIGN_PHRASES = tuple(sys.intern(s) for s in (
+    "你好，世界",
+    "こんにちは世界",
+    "안녕하세요 세계",
     "Привет, мир",
     "مرحبا بالعالم"
-]
-RELEASE_GROUP_MESSAGES = [
+))
+RELEASE_GROUP_MESSAGES = tuple(sys.intern(s) for s in (
     "[SubsBy-ReleaseGroup]",
     ">>> Subtitles by SubTeam <<<",
     "-- Visit www.example.com for more subtitles --",
     "*** PLEASE SUPPORT OUR WORK ***",
     "== Synced and corrected by SubsTeam =="
-]
+))
 ENCODING_ISSUES = {
     "'": ["'", "´", "`", "'"],
     '"': ['"', '"', '″', '„', '«', '»'],
@@ -69,6 +91,18 @@ PHONEME_MAPPING = {
     'Z': ['Z', 'ZH'],
 }
 
+# Single alternation matching every encoding-issue trigger, longest first so
+# "..." wins over ".": one linear scan replaces the per-key in/replace scans
+_ENCODING_PATTERN = re.compile(
+    "|".join(map(re.escape, sorted(ENCODING_ISSUES, key=len, reverse=True)))
+)
+
+# O(1) character dispatch for phoneme lookup: index by ord(char) instead of
+# hashing into PHONEME_MAPPING on every character
+PHONEME_TABLE = [None] * 128
+for _char, _candidates in PHONEME_MAPPING.items():
+    PHONEME_TABLE[ord(_char)] = tuple(_candidates)
+
 # Common words for generating subtitles
 COMMON_WORDS = [
     "the", "be", "to", "of", "and", "a", "in", "that", "have", "I", 
@@ -90,71 +124,139 @@ def generate_word():
 def generate_sentence(min_words=3, max_words=15):
     """Generate a random sentence."""
     num_words = random.randint(min_words, max_words)
-    words = [generate_word() for _ in range(num_words)]
+    # random.choices draws the whole word list in one C call instead of one
+    # Python-level random.choice frame per word
+    words = random.choices(COMMON_WORDS, k=num_words)
     words[0] = words[0].capitalize()
-    return " ".join(words) + random.choice([".", "!", "?"])
+    return " ".join(words) + random.choice(".!?")
+
+@functools.lru_cache(maxsize=4096)
+def _base_phonemes(word):
+    """
+    Deterministic phoneme sequence for a single uppercase word (cached).
+
+    The sentence vocabulary is tiny (~100 common words), so the char-to-
+    phoneme lookup for a given word repeats thousands of times across a large
+    set; caching it leaves only the cheap randomized error pass per call.
+    """
+    table = PHONEME_TABLE
+    return tuple(
+        table[byte][0]
+        for byte in word.encode('ascii', 'ignore')
+        if table[byte] is not None
+    )
+
 
 def generate_phonemes(text):
     """Generate mock phonemes for text."""
     # Simple phoneme generation - not linguistically accurate
+    base = []
+    for word in text.upper().split():
+        base.extend(_base_phonemes(word))
+
+    # Randomized error pass: 10% chance of a missing phoneme, then 5% chance
+    # of an error (replace with a similar phoneme, or delete). The three
+    # decision streams are pre-drawn in one batch per array so the loop body
+    # does plain indexing instead of RNG calls.
+    n = len(base)
+    if _rng is not None:
+        drops = _rng.random(n) < 0.1
+        errors = _rng.random(n) < 0.05
+        replaces = _rng.random(n) < 0.5
+    else:
+        rand = random.random
+        drops = [rand() < 0.1 for _ in range(n)]
+        errors = [rand() < 0.05 for _ in range(n)]
+        replaces = [rand() < 0.5 for _ in range(n)]
+
+    choice = random.choice
+    table = PHONEME_TABLE
     phonemes = []
-    for char in text.upper():
-        if char in PHONEME_MAPPING and random.random() > 0.1:  # 10% chance of missing phoneme
-            phoneme = random.choice(PHONEME_MAPPING[char])
-            phonemes.append(phoneme)
-    
-    # Randomly introduce phoneme errors (5% chance)
-    for i in range(len(phonemes)):
-        if random.random() < 0.05:
-            if random.random() < 0.5:
+    append = phonemes.append
+    for i, phoneme in enumerate(base):
+        if drops[i]:
+            continue
+        if errors[i]:
+            if replaces[i]:
                 # Replace with similar phoneme
-                char = phonemes[i][0]
-                if char in PHONEME_MAPPING:
-                    phonemes[i] = random.choice(PHONEME_MAPPING[char])
+                candidates = table[ord(phoneme[0])]
+                if candidates is not None:
+                    phoneme = choice(candidates)
             else:
                 # Delete phoneme
-                phonemes[i] = ""
-    
-    # Filter out empty phonemes
-    phonemes = [p for p in phonemes if p]
-    
-    return phonemes
+                continue
+        append(phoneme)
+
+    # Tuples serialize as JSON arrays in both orjson and json, and freezing
+    # the sequence keeps downstream consumers from mutating shared values
+    return tuple(phonemes)
+
+def _fmt_standard(hours, minutes, secs):
+    """hh:mm:ss:mmm formatter."""
+    return f"{hours:02d}:{minutes:02d}:{secs:06.3f}".replace(".", ":")
+
+def _fmt_decimal(hours, minutes, secs):
+    """hh:mm:ss.mmm formatter."""
+    return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
+
+def _fmt_frames(hours, minutes, secs):
+    """hh:mm:ss:ff formatter (assuming 30fps)."""
+    whole = int(secs)
+    frames = int((secs - whole) * 30)
+    return f"{hours:02d}:{minutes:02d}:{whole:02d}:{frames:02d}"
+
+# Dispatch table so format_timestamp does one dict lookup instead of walking
+# an if/elif chain per call
+_FORMATTERS = {
+    "standard": _fmt_standard,
+    "decimal": _fmt_decimal,
+    "frames": _fmt_frames,
+}
 
 def format_timestamp(seconds, format_type=None):
     """Format seconds into different timestamp formats."""
     if format_type is None:
-        format_type = random.choice(["standard", "decimal", "frames"])
-    
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = seconds % 60
-    
-    if format_type == "standard":
-        return f"{hours:02d}:{minutes:02d}:{secs:06.3f}".replace(".", ":")
-    elif format_type == "decimal":
-        return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
-    elif format_type == "frames":
-        frames = int((secs - int(secs)) * 30)  # Assuming 30fps
-        return f"{hours:02d}:{minutes:02d}:{int(secs):02d}:{frames:02d}"
-    else:
+        format_type = random.choice(("standard", "decimal", "frames"))
+
+    formatter = _FORMATTERS.get(format_type)
+    if formatter is None:
         return str(seconds)
 
+    whole = int(seconds)
+    hours, rem = divmod(whole, 3600)
+    minutes, whole_secs = divmod(rem, 60)
+    return formatter(hours, minutes, whole_secs + (seconds - whole))
+
 def introduce_encoding_issues(text, probability=0.3):
     """Introduce encoding issues into text."""
     if random.random() > probability:
         return text
-    
-    for original, replacements in ENCODING_ISSUES.items():
-        if original in text and random.random() < 0.3:
-            replacement = random.choice(replacements)
-            text = text.replace(original, replacement, 1)
-    
-    # Randomly add a zero-width space or other invisible character
+
+    # Replace the first occurrence of each trigger with 30% probability, all
+    # in one scan of the string
+    seen = set()
+
+    def _substitute(match):
+        original = match.group(0)
+        if original in seen:
+            return original
+        # Mark the key at its first occurrence no matter how the roll goes,
+        # so each trigger gets exactly one 30% roll per text
+        seen.add(original)
+        if random.random() >= 0.3:
+            return original
+        return random.choice(ENCODING_ISSUES[original])
+
+    text = _ENCODING_PATTERN.sub(_substitute, text)
+
+    # Randomly add a zero-width space or other invisible character. The
+    # f-string builds the result in one allocation instead of the two
+    # intermediate strings that chained + concatenation produces.
     if random.random() < 0.1:
         pos = random.randint(0, len(text) - 1)
-        invisible_char = random.choice(['\u200B', '\u200C', '\u200D', '\u2060'])
-        text = text[:pos] + invisible_char + text[pos:]
-    
+        invisible_char = random.choice('\u200B\u200C\u200D\u2060')
+        text = f"{text[:pos]}{invisible_char}{text[pos:]}"
+
     return text
 
 def introduce_transcription_errors(text, probability=0.2):
@@ -195,30 +297,40 @@ def introduce_transcription_errors(text, probability=0.2):
     
     return " ".join(words)
 
+# Precompiled per-variation scan patterns; search once, then substitute,
+# instead of an `in` scan followed by a str.replace rescan
+_PUNCT_PATTERNS = {
+    "newlines": re.compile(r"\n"),
+    "commas": re.compile(r", "),
+    "quotes": re.compile(r'"'),
+    "apostrophes": re.compile(r"'"),
+}
+
 def introduce_punctuation_variations(text, probability=0.3):
     """Introduce variations in punctuation."""
     if random.random() > probability:
         return text
-    
+
     variation_type = random.choice(["newlines", "commas", "quotes", "apostrophes"])
-    
+    pattern = _PUNCT_PATTERNS[variation_type]
+
     if variation_type == "newlines":
         # Add or remove newlines
-        if "\n" in text and random.random() < 0.5:
+        if pattern.search(text) and random.random() < 0.5:
             # Remove a newline
-            text = text.replace("\n", " ", 1)
+            text = pattern.sub(" ", text, count=1)
         else:
             # Add a newline
             words = text.split()
             if len(words) > 3:
                 split_point = random.randint(1, len(words) - 2)
                 text = " ".join(words[:split_point]) + "\n" + " ".join(words[split_point:])
-    
+
     elif variation_type == "commas":
         # Add or remove commas
-        if "," in text and random.random() < 0.5:
+        if pattern.search(text) and random.random() < 0.5:
             # Remove a comma
-            text = text.replace(", ", " ", 1)
+            text = pattern.sub(" ", text, count=1)
         else:
             # Add a comma
             words = text.split()
@@ -226,121 +338,240 @@ def introduce_punctuation_variations(text, probability=0.3):
                 comma_point = random.randint(1, len(words) - 2)
                 words[comma_point] = words[comma_point] + ","
                 text = " ".join(words)
-    
+
     elif variation_type == "quotes":
         # Change quote style
-        if '"' in text:
+        if pattern.search(text):
             replacement = random.choice(['"', '"', '«', '»'])
-            text = text.replace('"', replacement)
-    
+            text = pattern.sub(replacement, text)
+
     elif variation_type == "apostrophes":
         # Change apostrophe style
-        if "'" in text:
+        if pattern.search(text):
             replacement = random.choice(["'", "´", "`"])
-            text = text.replace("'", replacement)
-    
+            text = pattern.sub(replacement, text)
+
     return text
 
-def generate_subtitle_entry(idx, start_time, end_time, offset=0, format_type=None, include_challenges=True):
-    """Generate a single subtitle entry."""
-    # Decide if this will be a special entry
-    is_special = random.random() < 0.1 and include_challenges
-    
-    if is_special:
-        special_type = random.choice(["foreign", "release_group", "encoding_heavy", "missing_data"])
-        
-        if special_type == "foreign":
-            text = random.choice(FOREIGN_PHRASES)
-            speaker = random.choice(SPEAKERS)
-        elif special_type == "release_group":
-            text = random.choice(RELEASE_GROUP_MESSAGES)
-            speaker = ""  # No speaker for release group messages
-        elif special_type == "encoding_heavy":
-            text = introduce_encoding_issues(generate_sentence(), 0.9)
-            speaker = random.choice(SPEAKERS)
-        elif special_type == "missing_data":
+def _draw_special_text(speaker):
+    """Draw the text for a special entry; may clear the speaker."""
+    _choice = random.choice
+    special_type = _choice(("foreign", "release_group", "encoding_heavy", "missing_data"))
+
+    if special_type == "foreign":
+        return _choice(FOREIGN_PHRASES), speaker
+    if special_type == "release_group":
+        return _choice(RELEASE_GROUP_MESSAGES), ""  # No speaker for release group messages
+    if special_type == "encoding_heavy":
+        return introduce_encoding_issues(generate_sentence(), 0.9), speaker
+    # missing_data
+    return generate_sentence(), ("" if random.random() < 0.5 else speaker)
+
+def _make_entry_builder(offset, format_type, include_challenges):
+    """
+    Build an entry constructor specialized for one set's constant parameters.
+
+    offset, format_type and include_challenges are fixed across a whole set,
+    so the challenge branches are resolved once here instead of re-tested per
+    entry; each variant only carries the code its configuration can reach.
+    """
+    if not include_challenges:
+        def build_entry(idx, start_time, end_time, speaker, is_special):
             text = generate_sentence()
-            speaker = "" if random.random() < 0.5 else random.choice(SPEAKERS)
-    else:
-        text = generate_sentence()
-        speaker = random.choice(SPEAKERS)
-    
-    # Apply various transformations if challenges are enabled
-    if include_challenges:
-        # Introduce encoding issues
+            phonemes = generate_phonemes(text)
+            start_time += offset
+            end_time += offset
+            entry = {
+                "id": idx,
+                "start": format_timestamp(start_time, format_type),
+                "end": format_timestamp(end_time, format_type),
+                "text": text,
+                "phonemes": phonemes
+            }
+            if speaker:
+                entry["speaker"] = speaker
+            return entry, end_time
+        return build_entry
+
+    def build_entry(idx, start_time, end_time, speaker, is_special):
+        if is_special:
+            text, speaker = _draw_special_text(speaker)
+        else:
+            text = generate_sentence()
+
+        # Introduce encoding issues, transcription errors, and punctuation
+        # variations
         text = introduce_encoding_issues(text)
-        
-        # Introduce transcription errors
         text = introduce_transcription_errors(text)
-        
-        # Introduce punctuation variations
         text = introduce_punctuation_variations(text)
-    
-    # Generate phonemes
-    phonemes = generate_phonemes(text)
-    
-    # Apply offset to second set
-    if offset != 0:
+
+        # Generate phonemes
+        phonemes = generate_phonemes(text)
+
+        # Apply offset to second set
         start_time += offset
         end_time += offset
-    
-    # Format timestamps
-    start_formatted = format_timestamp(start_time, format_type)
-    end_formatted = format_timestamp(end_time, format_type)
-    
-    # Sometimes create overlapping timestamps
-    if include_challenges and random.random() < 0.1:
-        # Make this subtitle overlap with the next one
-        end_time += random.uniform(0.1, 0.5)
-        end_formatted = format_timestamp(end_time, format_type)
-    
-    # Sometimes omit end timestamp
-    if include_challenges and random.random() < 0.05:
-        end_formatted = ""
-    
-    # Create the entry
-    entry = {
-        "id": idx,
-        "start": start_formatted,
-        "end": end_formatted,
-        "text": text,
-        "phonemes": phonemes
-    }
-    
-    # Add speaker if available
-    if speaker:
-        entry["speaker"] = speaker
-    
-    return entry, end_time
 
-def generate_subtitle_set(num_entries=50, base_duration=2.0, gap=0.5, offset=0, 
+        start_formatted = format_timestamp(start_time, format_type)
+
+        # Sometimes create overlapping timestamps
+        if random.random() < 0.1:
+            # Make this subtitle overlap with the next one
+            end_time += random.uniform(0.1, 0.5)
+
+        # Sometimes omit end timestamp
+        if random.random() < 0.05:
+            end_formatted = ""
+        else:
+            end_formatted = format_timestamp(end_time, format_type)
+
+        # Create the entry
+        entry = {
+            "id": idx,
+            "start": start_formatted,
+            "end": end_formatted,
+            "text": text,
+            "phonemes": phonemes
+        }
+
+        # Add speaker if available
+        if speaker:
+            entry["speaker"] = speaker
+
+        return entry, end_time
+
+    return build_entry
+
+def generate_subtitle_entry(idx, start_time, end_time, offset=0, format_type=None,
+                            include_challenges=True, speaker=None, is_special=None):
+    """
+    Generate a single subtitle entry.
+
+    Set-level callers may pre-draw speaker and is_special in one batch and
+    pass them in; when omitted, both are drawn here per call. Callers
+    generating a whole set should prefer _make_entry_builder directly to
+    avoid re-specializing per entry.
+    """
+    if is_special is None:
+        is_special = random.random() < 0.1
+    if speaker is None:
+        speaker = random.choice(SPEAKERS)
+    build_entry = _make_entry_builder(offset, format_type, include_challenges)
+    return build_entry(idx, start_time, end_time, speaker, is_special)
+
+def iter_subtitle_entries(num_entries=50, base_duration=2.0, gap=0.5, offset=0,
                           format_type=None, include_challenges=True):
-    """Generate a set of subtitle entries."""
-    entries = []
+    """Lazily generate subtitle entries one at a time."""
     current_time = random.uniform(0, 10)  # Random start time
-    
+
+    # Pre-draw every per-entry random quantity in one batch per array instead
+    # of three Python-level RNG calls per entry
+    if _rng is not None:
+        durations = _rng.uniform(base_duration * 0.5, base_duration * 1.5, num_entries)
+        gaps = _rng.uniform(gap * 0.5, gap * 1.5, num_entries)
+        # Occasionally create a longer gap
+        long_gaps = np.where(_rng.random(num_entries) < 0.1,
+                             _rng.uniform(2, 5, num_entries), 0.0)
+    else:
+        durations = [random.uniform(base_duration * 0.5, base_duration * 1.5)
+                     for _ in range(num_entries)]
+        gaps = [random.uniform(gap * 0.5, gap * 1.5) for _ in range(num_entries)]
+        long_gaps = [random.uniform(2, 5) if random.random() < 0.1 else 0.0
+                     for _ in range(num_entries)]
+
+    # Per-entry speaker and special-entry draws, batched the same way
+    speakers = random.choices(SPEAKERS, k=num_entries)
+    if _rng is not None:
+        special_flags = _rng.random(num_entries) < 0.1
+    else:
+        special_flags = [random.random() < 0.1 for _ in range(num_entries)]
+
+    # Specialize the entry constructor once for this set's constant parameters
+    build_entry = _make_entry_builder(offset, format_type, include_challenges)
+
     for i in range(num_entries):
-        # Determine duration for this subtitle
-        duration = random.uniform(base_duration * 0.5, base_duration * 1.5)
-        
         # Generate the entry
-        entry, end_time = generate_subtitle_entry(
-            i, current_time, current_time + duration, 
-            offset, format_type, include_challenges
+        entry, end_time = build_entry(
+            i, current_time, current_time + durations[i],
+            speakers[i], special_flags[i]
         )
-        entries.append(entry)
-        
+        yield entry
+
         # Update current time for next entry
-        current_time = end_time + random.uniform(gap * 0.5, gap * 1.5)
-        
-        # Occasionally create a longer gap
-        if random.random() < 0.1:
-            current_time += random.uniform(2, 5)
-    
-    return entries
+        current_time = end_time + gaps[i] + long_gaps[i]
+
+def generate_subtitle_set(num_entries=50, base_duration=2.0, gap=0.5, offset=0,
+                          format_type=None, include_challenges=True):
+    """Generate a set of subtitle entries."""
+    return list(iter_subtitle_entries(
+        num_entries, base_duration, gap, offset, format_type, include_challenges
+    ))
+
+@dataclass(slots=True)
+class SubtitleColumns:
+    """
+    Struct-of-arrays view of a subtitle set.
+
+    Consumers that walk one field across the whole set (timestamp math,
+    phoneme comparisons, serialization) touch one contiguous list instead of
+    pointer-chasing the same key through every record dict. Missing fields
+    are represented as None ("speaker", "end") so columns stay parallel.
+    """
+
+    ids: list
+    starts: list
+    ends: list
+    texts: list
+    speakers: list
+    phonemes: list
+
+    @classmethod
+    def from_records(cls, entries):
+        """Build columns from a list of subtitle entry dicts."""
+        columns = cls(ids=[], starts=[], ends=[], texts=[], speakers=[], phonemes=[])
+        for entry in entries:
+            columns.ids.append(entry.get("id"))
+            columns.starts.append(entry.get("start"))
+            columns.ends.append(entry.get("end"))
+            columns.texts.append(entry.get("text"))
+            columns.speakers.append(entry.get("speaker"))
+            columns.phonemes.append(entry.get("phonemes"))
+        return columns
+
+    def to_records(self):
+        """Rebuild the list-of-dicts form, omitting absent speakers."""
+        records = []
+        for entry_id, start, end, text, speaker, phonemes in zip(
+            self.ids, self.starts, self.ends, self.texts, self.speakers, self.phonemes
+        ):
+            record = {
+                "id": entry_id,
+                "start": start,
+                "end": end,
+                "text": text,
+                "phonemes": phonemes,
+            }
+            if speaker:
+                record["speaker"] = speaker
+            records.append(record)
+        return records
 
+    def time_arrays(self):
+        """
+        Parse the start/end columns into float-second arrays.
+
+        Only meaningful for normalized sets whose timestamps are numeric
+        (raw generated sets carry formatted strings). Returns numpy float64
+        arrays when numpy is installed, plain lists of floats otherwise.
+        """
+        if np is not None:
+            return (np.asarray(self.starts, dtype=np.float64),
+                    np.asarray(self.ends, dtype=np.float64))
+        return ([float(s) for s in self.starts], [float(e) for e in self.ends])
+
+@functools.lru_cache(maxsize=None)
 def create_schema(include_speaker=True):
-    """Create a schema for the subtitle data."""
+    """Create a schema for the subtitle data (memoized per include_speaker)."""
     properties = {
         "id": {"type": "integer", "description": "Unique identifier for the subtitle entry"},
         "start": {"type": "string", "description": "Start timestamp for the subtitle"},
@@ -364,133 +595,162 @@ def create_schema(include_speaker=True):
     
     return schema
 
+def _dump_json(obj, file_path):
+    """Write an object as indented JSON, via orjson when available."""
+    if orjson is not None:
+        with open(file_path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, ensure_ascii=False, indent=2)
+
+
+# Directories already created by this process; repeated generators skip the
+# per-component stat walk inside os.makedirs for paths seen before
+_created_dirs = set()
+
+def _ensure_dir(path):
+    """os.makedirs(..., exist_ok=True) that runs once per path per process."""
+    if path not in _created_dirs:
+        os.makedirs(path, exist_ok=True)
+        _created_dirs.add(path)
+
+
+def _stream_json_array(entries, file_path):
+    """
+    Stream an iterable of entries to a JSON array file, one entry at a time.
+
+    Unlike _dump_json, this never holds more than one serialized entry in
+    memory, so generation can scale to arbitrarily large sets. Returns the
+    number of entries written.
+    """
+    if orjson is not None:
+        dumps = orjson.dumps
+    else:
+        dumps = lambda entry: json.dumps(entry, ensure_ascii=False).encode("utf-8")
+
+    count = 0
+    with open(file_path, "wb") as f:
+        write = f.write
+        write(b"[\n")
+        for entry in entries:
+            if count:
+                write(b",\n")
+            write(dumps(entry))
+            count += 1
+        write(b"\n]")
+    return count
+
+
 def generate_test_data(output_dir, num_entries=50, offset=5.0, include_challenges=True):
     """Generate test data for the subtitle alignment competition."""
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Generate set 1 with standard format
-    set1 = generate_subtitle_set(
-        num_entries=num_entries,
-        format_type="standard",
-        include_challenges=include_challenges
+    _ensure_dir(output_dir)
+
+    # Stream each set straight to disk as it is generated, so peak memory is
+    # one entry rather than the whole set
+    set1_count = _stream_json_array(
+        iter_subtitle_entries(
+            num_entries=num_entries,
+            format_type="standard",
+            include_challenges=include_challenges
+        ),
+        os.path.join(output_dir, "set1-subtitles.json")
     )
-    
-    # Generate set 2 with decimal format and offset
-    set2 = generate_subtitle_set(
-        num_entries=num_entries,
-        format_type="decimal",
-        offset=offset,
-        include_challenges=include_challenges
+    set2_count = _stream_json_array(
+        iter_subtitle_entries(
+            num_entries=num_entries,
+            format_type="decimal",
+            offset=offset,
+            include_challenges=include_challenges
+        ),
+        os.path.join(output_dir, "set2-subtitles.json")
     )
-    
-    # Create schemas
-    schema1 = create_schema(include_speaker=True)
-    schema2 = create_schema(include_speaker=True)
-    
-    # Write data to files
-    with open(os.path.join(output_dir, "set1-subtitles.json"), "w", encoding="utf-8") as f:
-        json.dump(set1, f, ensure_ascii=False, indent=2)
-    
-    with open(os.path.join(output_dir, "set2-subtitles.json"), "w", encoding="utf-8") as f:
-        json.dump(set2, f, ensure_ascii=False, indent=2)
-    
-    with open(os.path.join(output_dir, "set1-schema.json"), "w", encoding="utf-8") as f:
-        json.dump(schema1, f, ensure_ascii=False, indent=2)
-    
-    with open(os.path.join(output_dir, "set2-schema.json"), "w", encoding="utf-8") as f:
-        json.dump(schema2, f, ensure_ascii=False, indent=2)
-    
+
+    # Both sets share the same schema
+    schema = create_schema(include_speaker=True)
+    _dump_json(schema, os.path.join(output_dir, "set1-schema.json"))
+    _dump_json(schema, os.path.join(output_dir, "set2-schema.json"))
+
     print(f"Generated test data in {output_dir}")
-    print(f"- Set 1: {len(set1)} entries")
-    print(f"- Set 2: {len(set2)} entries with {offset}s offset")
+    print(f"- Set 1: {set1_count} entries")
+    print(f"- Set 2: {set2_count} entries with {offset}s offset")
 
-def generate_challenge_sets(output_dir, base_entries=30):
-    """Generate multiple challenge sets with different characteristics."""
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Challenge 1: Basic alignment with consistent offset
+def _build_challenge_basic(output_dir, base_entries, seed):
+    """Challenge 1: basic alignment with consistent offset."""
+    random.seed(seed)
     challenge_dir = os.path.join(output_dir, "challenge1_basic")
-    os.makedirs(challenge_dir, exist_ok=True)
+    _ensure_dir(challenge_dir)
     generate_test_data(
-        challenge_dir, 
-        num_entries=base_entries, 
-        offset=3.5, 
+        challenge_dir,
+        num_entries=base_entries,
+        offset=3.5,
         include_challenges=False
     )
-    
-    # Challenge 2: Alignment with encoding issues
+
+def _build_challenge_encoding(output_dir, base_entries, seed):
+    """Challenge 2: alignment with encoding issues."""
+    random.seed(seed)
     challenge_dir = os.path.join(output_dir, "challenge2_encoding")
-    os.makedirs(challenge_dir, exist_ok=True)
+    _ensure_dir(challenge_dir)
     generate_test_data(
-        challenge_dir, 
-        num_entries=base_entries, 
-        offset=4.2, 
-        include_challenges=True
-    )
-    
-    # Challenge 3: Alignment with varying offset
-    challenge_dir = os.path.join(output_dir, "challenge3_varying_offset")
-    os.makedirs(challenge_dir, exist_ok=True)
-    
-    # Generate set 1
-    set1 = generate_subtitle_set(
+        challenge_dir,
         num_entries=base_entries,
-        format_type="standard",
+        offset=4.2,
         include_challenges=True
     )
-    
+
+def _build_challenge_varying_offset(output_dir, base_entries, set1, seed):
+    """Challenge 3: alignment with varying offset."""
+    random.seed(seed)
+    challenge_dir = os.path.join(output_dir, "challenge3_varying_offset")
+    _ensure_dir(challenge_dir)
+    schema = create_schema(include_speaker=True)
+
     # Generate set 2 with varying offset
     set2 = []
     current_time = random.uniform(0, 10)
     base_offset = 5.0
     current_offset = base_offset
     
+    # Specialize the entry builder once for the whole set; the per-entry
+    # offset is applied to the timestamps at call time (builder offset 0)
+    # rather than re-specializing the closure for every entry
+    build_entry = _make_entry_builder(0, "decimal", True)
+
     for i in range(base_entries):
         # Gradually change the offset
         if i > 0 and i % 5 == 0:
             current_offset += random.uniform(-0.5, 0.5)
-        
+
         # Determine duration for this subtitle
         duration = random.uniform(1.0, 3.0)
-        
+
         # Generate the entry with current offset
-        entry, end_time = generate_subtitle_entry(
-            i, current_time, current_time + duration, 
-            current_offset, "decimal", True
+        is_special = random.random() < 0.1
+        speaker = random.choice(SPEAKERS)
+        entry, end_time = build_entry(
+            i, current_time + current_offset,
+            current_time + duration + current_offset,
+            speaker, is_special
         )
         set2.append(entry)
-        
+
         # Update current time for next entry
         current_time = end_time - current_offset + random.uniform(0.2, 0.8)
     
-    # Create schemas
-    schema1 = create_schema(include_speaker=True)
-    schema2 = create_schema(include_speaker=True)
-    
     # Write data to files
-    with open(os.path.join(challenge_dir, "set1-subtitles.json"), "w", encoding="utf-8") as f:
-        json.dump(set1, f, ensure_ascii=False, indent=2)
-    
-    with open(os.path.join(challenge_dir, "set2-subtitles.json"), "w", encoding="utf-8") as f:
-        json.dump(set2, f, ensure_ascii=False, indent=2)
-    
-    with open(os.path.join(challenge_dir, "set1-schema.json"), "w", encoding="utf-8") as f:
-        json.dump(schema1, f, ensure_ascii=False, indent=2)
-    
-    with open(os.path.join(challenge_dir, "set2-schema.json"), "w", encoding="utf-8") as f:
-        json.dump(schema2, f, ensure_ascii=False, indent=2)
-    
-    # Challenge 4: Alignment with missing data
+    _dump_json(set1, os.path.join(challenge_dir, "set1-subtitles.json"))
+    _dump_json(set2, os.path.join(challenge_dir, "set2-subtitles.json"))
+    _dump_json(schema, os.path.join(challenge_dir, "set1-schema.json"))
+    _dump_json(schema, os.path.join(challenge_dir, "set2-schema.json"))
+
+def _build_challenge_missing_data(output_dir, base_entries, set1, seed):
+    """Challenge 4: alignment with missing data (set1 shared with challenge 3)."""
+    random.seed(seed)
     challenge_dir = os.path.join(output_dir, "challenge4_missing_data")
-    os.makedirs(challenge_dir, exist_ok=True)
-    
-    # Generate set 1
-    set1 = generate_subtitle_set(
-        num_entries=base_entries,
-        format_type="standard",
-        include_challenges=True
-    )
-    
+    _ensure_dir(challenge_dir)
+    schema = create_schema(include_speaker=True)
+
     # Generate set 2 with missing entries
     set2 = generate_subtitle_set(
         num_entries=base_entries - 5,  # Fewer entries
@@ -499,34 +759,64 @@ def generate_challenge_sets(output_dir, base_entries=30):
         include_challenges=True
     )
     
-    # Randomly remove some fields
-    for entry in set2:
-        if random.random() < 0.2:
-            if "speaker" in entry:
-                del entry["speaker"]
-        if random.random() < 0.1:
-            if "end" in entry:
-                del entry["end"]
-        if random.random() < 0.15:
-            entry["phonemes"] = entry["phonemes"][:len(entry["phonemes"])//2]
-    
-    # Create schemas
-    schema1 = create_schema(include_speaker=True)
-    schema2 = create_schema(include_speaker=True)
+    # Randomly remove some fields; masks are pre-drawn in one batch per
+    # column, and pop(..., None) drops the membership-test branch
+    n = len(set2)
+    if _rng is not None:
+        del_speaker = _rng.random(n) < 0.2
+        del_end = _rng.random(n) < 0.1
+        trunc_phonemes = _rng.random(n) < 0.15
+    else:
+        del_speaker = [random.random() < 0.2 for _ in range(n)]
+        del_end = [random.random() < 0.1 for _ in range(n)]
+        trunc_phonemes = [random.random() < 0.15 for _ in range(n)]
+
+    for i, entry in enumerate(set2):
+        if del_speaker[i]:
+            entry.pop("speaker", None)
+        if del_end[i]:
+            entry.pop("end", None)
+        if trunc_phonemes[i]:
+            entry["phonemes"] = entry["phonemes"][:len(entry["phonemes"]) // 2]
     
     # Write data to files
-    with open(os.path.join(challenge_dir, "set1-subtitles.json"), "w", encoding="utf-8") as f:
-        json.dump(set1, f, ensure_ascii=False, indent=2)
-    
-    with open(os.path.join(challenge_dir, "set2-subtitles.json"), "w", encoding="utf-8") as f:
-        json.dump(set2, f, ensure_ascii=False, indent=2)
-    
-    with open(os.path.join(challenge_dir, "set1-schema.json"), "w", encoding="utf-8") as f:
-        json.dump(schema1, f, ensure_ascii=False, indent=2)
-    
-    with open(os.path.join(challenge_dir, "set2-schema.json"), "w", encoding="utf-8") as f:
-        json.dump(schema2, f, ensure_ascii=False, indent=2)
-    
+    _dump_json(set1, os.path.join(challenge_dir, "set1-subtitles.json"))
+    _dump_json(set2, os.path.join(challenge_dir, "set2-subtitles.json"))
+    _dump_json(schema, os.path.join(challenge_dir, "set1-schema.json"))
+    _dump_json(schema, os.path.join(challenge_dir, "set2-schema.json"))
+
+def generate_challenge_sets(output_dir, base_entries=30):
+    """Generate multiple challenge sets with different characteristics."""
+    _ensure_dir(output_dir)
+
+    # Challenges 3 and 4 share identically-specified set 1 data, generated
+    # once here and handed to both builders
+    set1 = generate_subtitle_set(
+        num_entries=base_entries,
+        format_type="standard",
+        include_challenges=True
+    )
+
+    # Each challenge builds an independent directory, so the four builders can
+    # run in worker processes; distinct seeds keep each worker's RNG stream
+    # independent of the others
+    tasks = [
+        (_build_challenge_basic, (output_dir, base_entries, random.getrandbits(32))),
+        (_build_challenge_encoding, (output_dir, base_entries, random.getrandbits(32))),
+        (_build_challenge_varying_offset, (output_dir, base_entries, set1, random.getrandbits(32))),
+        (_build_challenge_missing_data, (output_dir, base_entries, set1, random.getrandbits(32))),
+    ]
+    try:
+        with ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1)) as executor:
+            futures = [executor.submit(builder, *args) for builder, args in tasks]
+            for future in futures:
+                future.result()
+    except OSError:
+        # Process pools can be unavailable (restricted environments); fall
+        # back to building the challenges serially
+        for builder, args in tasks:
+            builder(*args)
+
     print(f"Generated challenge sets in {output_dir}")
 
 def main():
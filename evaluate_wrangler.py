@@ -6,16 +6,30 @@ This script evaluates the Freestyle Wrangler component of competitor solutions
 by testing their ability to normalize subtitle data with various challenges.
 """
 
+import functools
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import sys
 import json
 import time
 import argparse
+import importlib.machinery
 import importlib.util
+import py_compile
 from pathlib import Path
 from typing import Any
 import traceback
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 
 def load_module_from_path(module_name: str, file_path: str):
     """
@@ -31,7 +45,34 @@ def load_module_from_path(module_name: str, file_path: str):
     Raises:
         ImportError: If the module cannot be loaded
     """
-    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    file_path = os.path.abspath(file_path)
+    return _load_module_cached(module_name, file_path, os.path.getmtime(file_path))
+
+
+@functools.lru_cache(maxsize=16)
+def _load_module_cached(module_name: str, file_path: str, mtime: float):
+    """
+    Load and execute a module, memoized on (name, absolute path, mtime).
+
+    Re-evaluating the same competitor against many test sets in one session
+    would otherwise re-parse and re-execute the module (and re-pay any JIT
+    warmup it performs) on every call. The mtime key invalidates the cache
+    when the source file is edited.
+    """
+    # Compile to bytecode up front so exec skips the parse/compile step; the
+    # .pyc lands in __pycache__ where later runs (and tools like Numba with
+    # cache=True) can reuse it. Fall back to source loading if compilation
+    # is not possible (e.g. an unwritable __pycache__ or a syntax error,
+    # which then surfaces naturally from exec_module).
+    try:
+        pyc_path = py_compile.compile(file_path, doraise=True)
+        spec = importlib.util.spec_from_file_location(
+            module_name,
+            pyc_path,
+            loader=importlib.machinery.SourcelessFileLoader(module_name, pyc_path)
+        )
+    except (py_compile.PyCompileError, OSError):
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
     if spec is None or spec.loader is None:
         raise ImportError(f"Could not load module from {file_path}")
 
@@ -55,8 +96,128 @@ def load_subtitles(file_path: str) -> list[dict[str, Any]]:
         FileNotFoundError: If the file does not exist
         json.JSONDecodeError: If the file contains invalid JSON
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    raw = _read_subtitle_bytes(os.path.abspath(file_path), os.path.getmtime(file_path))
+    if orjson is not None:
+        # orjson parses bytes directly, skipping the text-decoding layer in open()
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@functools.lru_cache(maxsize=64)
+def _read_subtitle_bytes(file_path: str, mtime: float) -> bytes:
+    """
+    Read a subtitle file's bytes, memoized on (absolute path, mtime).
+
+    Re-runs against the same corpus (common during development) skip the
+    repeated disk read; editing a file invalidates its entry. Only the
+    immutable bytes are cached — each load_subtitles call decodes a fresh
+    object tree, because competitor wranglers normalize captions in place
+    and a cached list of dicts would be corrupted by the first of them.
+    """
+    return Path(file_path).read_bytes()
+
+
+def iter_subtitles(file_path: str):
+    """
+    Lazily iterate subtitle data from a JSON file.
+
+    Streams captions one at a time via ijson so peak memory stays proportional
+    to a single caption rather than the whole file. Without ijson installed,
+    the full file is loaded and then iterated.
+
+    Args:
+        file_path: Path to the JSON file
+
+    Yields:
+        Subtitle dictionaries, one at a time
+    """
+    if ijson is not None:
+        with open(file_path, 'rb') as f:
+            yield from ijson.items(f, 'item')
+    else:
+        yield from load_subtitles(file_path)
+
+
+class _LazyTraceback:
+    """
+    Defer traceback formatting until the error report is serialized.
+
+    traceback.format_exc() walks the whole stack and reads source lines from
+    disk, which dominates wall time when a broken wrangler fails on every
+    caption. Holding the exception and formatting on first str() means the
+    cost is only paid for tracebacks that actually end up in the report.
+    """
+
+    __slots__ = ('_exc', '_formatted')
+
+    def __init__(self, exc: BaseException):
+        self._exc = exc
+        self._formatted = None
+
+    def __str__(self) -> str:
+        if self._formatted is None:
+            self._formatted = ''.join(
+                traceback.format_exception(type(self._exc), self._exc, self._exc.__traceback__)
+            )
+            self._exc = None  # release the frame chain once formatted
+        return self._formatted
+
+
+def _traceback_key(exc: BaseException) -> tuple:
+    """Cheap identity for deduplicating repeated identical failures."""
+    tb = exc.__traceback__
+    while tb is not None and tb.tb_next is not None:
+        tb = tb.tb_next
+    return (type(exc), str(exc), tb.tb_lineno if tb is not None else 0)
+
+
+# Validation constants, hoisted to module scope so they are not re-allocated
+# on every validate call.
+_REQUIRED_FIELDS = ('id', 'start', 'end', 'text', 'phonemes')
+_NUMBER = (int, float)
+_ID_TYPES = (int, str)
+
+
+def _is_valid_subtitle(subtitle: dict[str, Any]) -> bool:
+    """
+    Fast boolean-only check mirroring validate_normalized_subtitle.
+
+    This is the hot path of the evaluator loop: valid captions (the common
+    case) are accepted without allocating any error strings or lists.
+
+    Args:
+        subtitle: A normalized subtitle dictionary
+
+    Returns:
+        True if the subtitle passes all validation checks
+    """
+    try:
+        start = subtitle['start']
+        end = subtitle['end']
+        phonemes = subtitle['phonemes']
+        if not (
+            isinstance(subtitle['id'], _ID_TYPES)
+            and isinstance(start, _NUMBER)
+            and isinstance(end, _NUMBER)
+            and isinstance(subtitle['text'], str)
+            and isinstance(phonemes, list)
+        ):
+            return False
+    except KeyError:
+        return False
+
+    if start > end:
+        return False
+
+    if 'speaker' in subtitle and not isinstance(subtitle['speaker'], str):
+        return False
+
+    if 'phoneme_ids' in subtitle:
+        phoneme_ids = subtitle['phoneme_ids']
+        if isinstance(phoneme_ids, (str, dict)) or not hasattr(phoneme_ids, '__iter__'):
+            return False
+
+    return all(isinstance(p, str) for p in phonemes)
 
 
 def validate_normalized_subtitle(subtitle: dict[str, Any]) -> tuple[bool, list[str]]:
@@ -70,22 +231,24 @@ def validate_normalized_subtitle(subtitle: dict[str, Any]) -> tuple[bool, list[s
         A tuple (is_valid, errors) where is_valid is True if the subtitle is valid,
         and errors is a list of error messages if it's not valid
     """
+    if _is_valid_subtitle(subtitle):
+        return True, []
+
     errors = []
 
     # Check required fields
-    required_fields = ['id', 'start', 'end', 'text', 'phonemes']
-    for field in required_fields:
+    for field in _REQUIRED_FIELDS:
         if field not in subtitle:
             errors.append(f"Missing required field: {field}")
 
     # Check field types
-    if 'id' in subtitle and not isinstance(subtitle['id'], (int, str)):
+    if 'id' in subtitle and not isinstance(subtitle['id'], _ID_TYPES):
         errors.append(f"Field 'id' must be an integer or string, got {type(subtitle['id'])}")
 
-    if 'start' in subtitle and not isinstance(subtitle['start'], (int, float)):
+    if 'start' in subtitle and not isinstance(subtitle['start'], _NUMBER):
         errors.append(f"Field 'start' must be a number, got {type(subtitle['start'])}")
 
-    if 'end' in subtitle and not isinstance(subtitle['end'], (int, float)):
+    if 'end' in subtitle and not isinstance(subtitle['end'], _NUMBER):
         errors.append(f"Field 'end' must be a number, got {type(subtitle['end'])}")
 
     if 'text' in subtitle and not isinstance(subtitle['text'], str):
@@ -93,7 +256,8 @@ def validate_normalized_subtitle(subtitle: dict[str, Any]) -> tuple[bool, list[s
 
     if 'phonemes' in subtitle and not isinstance(subtitle['phonemes'], list):
         errors.append(f"Field 'phonemes' must be a list, got {type(subtitle['phonemes'])}")
-    elif 'phonemes' in subtitle:
+    elif 'phonemes' in subtitle and not all(isinstance(p, str) for p in subtitle['phonemes']):
+        # Only hunt down the offending indexes once the cheap all() check fails
         for i, phoneme in enumerate(subtitle['phonemes']):
             if not isinstance(phoneme, str):
                 errors.append(f"Phoneme at index {i} must be a string, got {type(phoneme)}")
@@ -101,6 +265,13 @@ def validate_normalized_subtitle(subtitle: dict[str, Any]) -> tuple[bool, list[s
     if 'speaker' in subtitle and not isinstance(subtitle['speaker'], str):
         errors.append(f"Field 'speaker' must be a string, got {type(subtitle['speaker'])}")
 
+    # Optional compact encoding (see interfaces/phoneme_alphabet.py): any
+    # integer sequence is accepted alongside the canonical phoneme strings
+    if 'phoneme_ids' in subtitle:
+        phoneme_ids = subtitle['phoneme_ids']
+        if isinstance(phoneme_ids, (str, dict)) or not hasattr(phoneme_ids, '__iter__'):
+            errors.append(f"Field 'phoneme_ids' must be an integer sequence, got {type(phoneme_ids)}")
+
     # Check timestamp ordering
     if 'start' in subtitle and 'end' in subtitle:
         if subtitle['start'] > subtitle['end']:
@@ -109,11 +280,53 @@ def validate_normalized_subtitle(subtitle: dict[str, Any]) -> tuple[bool, list[s
     return len(errors) == 0, errors
 
 
+@functools.lru_cache(maxsize=16)
+def _discover_test_sets(test_data_dir: str) -> tuple[tuple[str, str], ...]:
+    """
+    Find all test sets under a data directory, memoized per directory.
+
+    A test set is any directory containing both set1-subtitles.json and
+    set2-subtitles.json. The result is cached so evaluating several
+    competitors against the same corpus only walks the tree once.
+
+    Returns:
+        A tuple of (test_set_name, test_set_dir) pairs, sorted by name
+    """
+    # os.scandir gives one syscall per directory with cached entry types,
+    # where os.walk pays a stat per entry on some platforms.
+    test_sets = []
+    stack = [test_data_dir]
+    while stack:
+        directory = stack.pop()
+        has_set1 = has_set2 = False
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name == "set1-subtitles.json":
+                        has_set1 = True
+                    elif entry.name == "set2-subtitles.json":
+                        has_set2 = True
+        except OSError:
+            continue
+
+        if has_set1 and has_set2:
+            test_set_name = os.path.relpath(directory, test_data_dir)
+            if test_set_name == ".":
+                test_set_name = "default"
+            test_sets.append((test_set_name, directory))
+
+    test_sets.sort()
+    return tuple(test_sets)
+
+
 def evaluate_wrangler(
     competitor_dir: str,
     test_data_dir: str,
     output_dir: str | None = None,
-    verbose: bool = False
+    verbose: bool = False,
+    jobs: int = 1
 ) -> dict[str, Any]:
     """
     Evaluate the Freestyle Wrangler component of a competitor solution.
@@ -123,6 +336,7 @@ def evaluate_wrangler(
         test_data_dir: Path to the test data directory
         output_dir: Path to save evaluation results (optional)
         verbose: Whether to print verbose output
+        jobs: Number of worker processes for normalization (1 = serial)
 
     Returns:
         A dictionary containing evaluation results
@@ -145,6 +359,7 @@ def evaluate_wrangler(
     try:
         wrangler_module = load_module_from_path("wrangler", wrangler_path)
         normalize_subtitles = getattr(wrangler_module, "normalize_subtitles")
+        normalize_batch = getattr(wrangler_module, "normalize_subtitles_batch", None)
     except Exception as e:
         error_msg = f"Error loading wrangler module: {str(e)}\n{traceback.format_exc()}"
         print(error_msg)
@@ -157,13 +372,7 @@ def evaluate_wrangler(
         }
 
     # Find test data sets
-    test_sets = []
-    for root, dirs, files in os.walk(test_data_dir):
-        if "set1-subtitles.json" in files and "set2-subtitles.json" in files:
-            test_set_name = os.path.relpath(root, test_data_dir)
-            if test_set_name == ".":
-                test_set_name = "default"
-            test_sets.append((test_set_name, root))
+    test_sets = _discover_test_sets(test_data_dir)
 
     if not test_sets:
         print(f"Error: No test data found in {test_data_dir}")
@@ -193,11 +402,13 @@ def evaluate_wrangler(
         set1_path = os.path.join(test_set_dir, "set1-subtitles.json")
         set2_path = os.path.join(test_set_dir, "set2-subtitles.json")
 
-        set1_subtitles = load_subtitles(set1_path)
-        set2_subtitles = load_subtitles(set2_path)
+        set1_subtitles = iter_subtitles(set1_path)
+        set2_subtitles = iter_subtitles(set2_path)
 
-        set1_results = evaluate_wrangler_on_set(normalize_subtitles, set1_subtitles, "set1", verbose)
-        set2_results = evaluate_wrangler_on_set(normalize_subtitles, set2_subtitles, "set2", verbose)
+        set1_results = evaluate_wrangler_on_set(normalize_subtitles, set1_subtitles, "set1", verbose,
+                                                normalize_batch=normalize_batch, jobs=jobs)
+        set2_results = evaluate_wrangler_on_set(normalize_subtitles, set2_subtitles, "set2", verbose,
+                                                normalize_batch=normalize_batch, jobs=jobs)
 
         # Calculate scores
         set1_score = set1_results["score"]
@@ -227,8 +438,17 @@ def evaluate_wrangler(
     if output_dir:
         os.makedirs(output_dir, exist_ok=True)
         output_path = os.path.join(output_dir, f"{competitor_name}_wrangler_results.json")
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2)
+        # default=str formats any _LazyTraceback placeholders at write time
+        if orjson is not None:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    results,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2, default=str)
 
         if verbose:
             print(f"Results saved to {output_path}")
@@ -238,24 +458,33 @@ def evaluate_wrangler(
 
 def evaluate_wrangler_on_set(
     normalize_subtitles_func,
-    subtitles: list[dict[str, Any]],
+    subtitles,
     set_name: str,
-    verbose: bool = False
+    verbose: bool = False,
+    normalize_batch=None,
+    jobs: int = 1
 ) -> dict[str, Any]:
     """
     Evaluate the Freestyle Wrangler on a single subtitle set.
 
     Args:
         normalize_subtitles_func: The normalize_subtitles function from the competitor's solution
-        subtitles: list of subtitle dictionaries to normalize
+        subtitles: Iterable of subtitle dictionaries to normalize (may be a
+            lazy generator; it is consumed exactly once)
         set_name: Name of the subtitle set (for reporting)
         verbose: Whether to print verbose output
+        normalize_batch: Optional normalize_subtitles_batch function; when the
+            competitor provides one, the whole set is normalized in a single
+            call to amortize per-caption setup costs
+        jobs: Number of workers for parallel normalization; normalization is
+            embarrassingly parallel, so CPU-bound wranglers scale nearly
+            linearly with cores (1 = serial)
 
     Returns:
         A dictionary containing evaluation results for this set
     """
     results = {
-        "total_subtitles": len(subtitles),
+        "total_subtitles": 0,
         "successful_normalizations": 0,
         "failed_normalizations": 0,
         "validation_errors": 0,
@@ -267,23 +496,65 @@ def evaluate_wrangler_on_set(
     normalized_subtitles = []
     start_time = time.time()
 
+    # Prefer the batch entry point when the competitor provides one; fall back
+    # to the per-caption path if the batch call fails or looks inconsistent.
+    batch_results = None
+    if normalize_batch is not None:
+        subtitles = list(subtitles)
+        try:
+            candidate = normalize_batch(subtitles)
+            if isinstance(candidate, list) and len(candidate) == len(subtitles):
+                batch_results = candidate
+        except Exception:
+            batch_results = None
+
+    # Fan captions out across workers; validation stays serial below since it
+    # is trivial next to normalization. Dynamically loaded wrangler functions
+    # often cannot be pickled for a process pool, so fall back to threads
+    # (useful when the wrangler releases the GIL) and then to the serial loop.
+    if jobs > 1 and batch_results is None:
+        subtitles = list(subtitles)
+        chunksize = max(1, len(subtitles) // (jobs * 4))
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                batch_results = list(executor.map(normalize_subtitles_func, subtitles, chunksize=chunksize))
+        except Exception:
+            try:
+                with ThreadPoolExecutor(max_workers=jobs) as executor:
+                    batch_results = list(executor.map(normalize_subtitles_func, subtitles))
+            except Exception:
+                batch_results = None
+
+    # Keep the per-caption counters in locals; dict item stores are measurably
+    # slower than local integer adds on this hot loop.
+    total = 0
+    successful = 0
+    failed = 0
+    validation_errors = 0
+    error_details = results["error_details"]
+    seen_tracebacks: dict[tuple, _LazyTraceback] = {}
+
     # Process each subtitle
     for i, subtitle in enumerate(subtitles):
+        total += 1
         try:
-            normalized = normalize_subtitles_func(subtitle)
+            if batch_results is not None:
+                normalized = batch_results[i]
+            else:
+                normalized = normalize_subtitles_func(subtitle)
             normalized_subtitles.append(normalized)
 
             # Validate the normalized subtitle
             is_valid, errors = validate_normalized_subtitle(normalized)
             if is_valid:
-                results["successful_normalizations"] += 1
+                successful += 1
             else:
-                results["validation_errors"] += 1
+                validation_errors += 1
                 error_detail = {
                     "subtitle_index": i,
                     "errors": errors
                 }
-                results["error_details"].append(error_detail)
+                error_details.append(error_detail)
 
                 if verbose:
                     print(f"Validation errors for subtitle {i} in {set_name}:")
@@ -291,17 +562,29 @@ def evaluate_wrangler_on_set(
                         print(f"  - {error}")
 
         except Exception as e:
-            results["failed_normalizations"] += 1
+            failed += 1
+            # A broken wrangler typically raises the same exception from the
+            # same line for every caption, so share one lazily formatted
+            # traceback per distinct failure instead of formatting N times.
+            key = _traceback_key(e)
+            lazy_tb = seen_tracebacks.get(key)
+            if lazy_tb is None:
+                lazy_tb = _LazyTraceback(e)
+                seen_tracebacks[key] = lazy_tb
             error_detail = {
                 "subtitle_index": i,
-                "exception": str(e),
-                "traceback": traceback.format_exc()
+                "exception": f"{type(e).__name__}: {e}",
+                "traceback": lazy_tb
             }
-            results["error_details"].append(error_detail)
+            error_details.append(error_detail)
 
             if verbose:
                 print(f"Error normalizing subtitle {i} in {set_name}: {str(e)}")
 
+    results["total_subtitles"] = total
+    results["successful_normalizations"] = successful
+    results["failed_normalizations"] = failed
+    results["validation_errors"] = validation_errors
     results["processing_time"] = time.time() - start_time
 
     # Calculate score (out of 100)
@@ -323,6 +606,8 @@ def main():
     parser.add_argument("--test-data", default="data", help="Path to the test data directory")
     parser.add_argument("--output-dir", help="Path to save evaluation results")
     parser.add_argument("--verbose", "-v", action="store_true", help="Print verbose output")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Number of worker processes for normalization (1 = serial)")
 
     args = parser.parse_args()
 
@@ -330,7 +615,8 @@ def main():
         args.competitor_dir,
         args.test_data,
         args.output_dir,
-        args.verbose
+        args.verbose,
+        jobs=args.jobs
     )
 
     print(f"Competitor: {results['competitor']}")
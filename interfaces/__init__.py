@@ -9,18 +9,26 @@ This package contains interface definitions for both components of the competiti
 
 from .wrangler_interface import normalize_subtitles, load_subtitles, save_subtitles
 from .alignment_interface import (
-    align_subtitles, 
-    AlignmentConfig, 
-    AlignmentResult, 
-    apply_offset
+    align_subtitles,
+    AlignmentConfig,
+    AlignmentResult,
+    apply_offset,
+    iter_offset
 )
+from .phoneme_alphabet import PHONEME_ALPHABET, encode_phonemes, decode_phonemes
+from .subtitle_table import SubtitleTable
 
 __all__ = [
+    'SubtitleTable',
     'normalize_subtitles',
     'align_subtitles',
     'AlignmentConfig',
     'AlignmentResult',
     'load_subtitles',
     'save_subtitles',
-    'apply_offset'
+    'apply_offset',
+    'iter_offset',
+    'PHONEME_ALPHABET',
+    'encode_phonemes',
+    'decode_phonemes'
 ]
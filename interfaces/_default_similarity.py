@@ -0,0 +1,41 @@
+
+"""
+Default Phonetic Similarity Backend
+
+Phoneme-sequence similarity is the per-cell cost of the Phonetic Walk, so
+the default backend should use a C implementation when one is installed.
+This module wraps python-Levenshtein behind the repo's guarded-import
+pattern; without it, scoring falls back to the pure-Python kernel in
+_walk_core. The work order also suggested a Double Metaphone stage, but
+the competition's phoneme fields are already ARPABET sequences, so
+re-deriving phonetic codes from them would only add noise.
+"""
+
+try:
+    from Levenshtein import distance as levenshtein_distance
+    from Levenshtein import ratio as levenshtein_ratio
+except ImportError:
+    levenshtein_distance = None
+    levenshtein_ratio = None
+
+
+def phonetic_similarity(phonemes1, phonemes2) -> float:
+    """
+    Normalized similarity between two phoneme string sequences.
+
+    Args:
+        phonemes1: First phoneme sequence (list of phoneme strings)
+        phonemes2: Second phoneme sequence
+
+    Returns:
+        Similarity in [0.0, 1.0]; 1.0 means identical sequences
+    """
+    if not phonemes1 or not phonemes2:
+        return 0.0
+    if levenshtein_ratio is not None:
+        return levenshtein_ratio(' '.join(phonemes1), ' '.join(phonemes2))
+
+    from ._walk_core import _encode, _levenshtein
+    enc1, enc2 = _encode(phonemes1), _encode(phonemes2)
+    longest = max(len(enc1), len(enc2))
+    return 1.0 - _levenshtein(enc1, enc2) / longest
@@ -0,0 +1,635 @@
+
+"""
+Reference Phonetic Walk Core
+
+ALGORITHM.md specifies the Phonetic Walk (anchor search, path following,
+offset validation) but the interface ships no executable reference. This
+module provides one, organized around integer-encoded phoneme sequences:
+each chunk's phonemes are mapped to compact ids once up front, so the hot
+per-cell similarity computation compares small integers instead of hashing
+strings. When numba is installed the Levenshtein kernel is JIT-compiled
+over uint8 arrays; otherwise a pure-Python two-row implementation is used.
+
+Competitor solutions are free to ignore this module; it exists so the
+evaluation side has a known-good baseline and so the interface's documented
+behavior is testable.
+"""
+
+from typing import Any, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+import functools
+
+from .alignment_types import AlignmentConfig, AlignmentResult
+from .phoneme_alphabet import _PH2ID, build_substitution_matrix
+
+# Id used for phonemes outside PHONEME_ALPHABET; it never equals a real id,
+# so unknown symbols simply never match
+_UNKNOWN_ID = 255
+
+
+def _encode(phonemes):
+    """
+    Encode a phoneme sequence as compact uint8 ids.
+
+    Unlike phoneme_alphabet.encode_phonemes, unknown symbols map to a
+    sentinel id instead of raising, since real wrangler output can contain
+    malformed phonemes.
+    """
+    ids = bytes(_PH2ID.get(p, _UNKNOWN_ID) for p in phonemes)
+    if np is not None:
+        return np.frombuffer(ids, dtype=np.uint8)
+    return ids
+
+
+def _encode_set(subtitles):
+    """
+    Encode one subtitle set for the walk.
+
+    Args:
+        subtitles: list of normalized subtitle dictionaries
+
+    Returns:
+        Tuple of (encoded phoneme sequences, start times, speakers)
+    """
+    encoded = [_encode(s.get('phonemes') or ()) for s in subtitles]
+    starts = [float(s['start']) for s in subtitles]
+    speakers = [s.get('speaker') for s in subtitles]
+    return encoded, starts, speakers
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _levenshtein(a, b):
+        """Levenshtein distance over two uint8 id arrays (JIT-compiled)."""
+        la, lb = len(a), len(b)
+        prev = np.arange(lb + 1, dtype=np.int32)
+        curr = np.empty(lb + 1, dtype=np.int32)
+        for i in range(1, la + 1):
+            curr[0] = i
+            ai = a[i - 1]
+            for j in range(1, lb + 1):
+                cost = 0 if ai == b[j - 1] else 1
+                curr[j] = min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + cost)
+            prev, curr = curr, prev
+        return prev[lb]
+else:
+    def _levenshtein(a, b):
+        """Levenshtein distance over two encoded sequences (two-row DP)."""
+        la, lb = len(a), len(b)
+        if lb > la:
+            a, b, la, lb = b, a, lb, la
+        prev = list(range(lb + 1))
+        for i in range(1, la + 1):
+            ai = a[i - 1]
+            curr = [i]
+            append = curr.append
+            for j in range(1, lb + 1):
+                cost = 0 if ai == b[j - 1] else 1
+                append(min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + cost))
+            prev = curr
+        return prev[lb]
+
+
+# Prefer the python-Levenshtein C extension over the pure-Python kernel when
+# numba is not around to compile it
+from ._default_similarity import levenshtein_distance as _c_distance
+
+if njit is None and _c_distance is not None:
+    def _levenshtein(a, b):
+        """Levenshtein distance via the python-Levenshtein C extension."""
+        return _c_distance(bytes(a), bytes(b))
+
+
+def _weighted_levenshtein(a, b, sub_costs):
+    """
+    Levenshtein distance with per-pair substitution costs.
+
+    sub_costs is a dense matrix indexed by phoneme id (see
+    phoneme_alphabet.build_substitution_matrix); ids outside the alphabet
+    (the unknown sentinel) cost a full substitution.
+    """
+    la, lb = len(a), len(b)
+    if lb > la:
+        a, b, la, lb = b, a, lb, la
+    size = len(sub_costs)
+    prev = [float(j) for j in range(lb + 1)]
+    for i in range(1, la + 1):
+        ai = a[i - 1]
+        row = sub_costs[ai] if ai < size else None
+        curr = [float(i)]
+        append = curr.append
+        for j in range(1, lb + 1):
+            bj = b[j - 1]
+            if ai == bj:
+                cost = 0.0
+            elif row is None or bj >= size:
+                cost = 1.0
+            else:
+                cost = row[bj]
+            append(min(prev[j] + 1.0, curr[j - 1] + 1.0, prev[j - 1] + cost))
+        prev = curr
+    return prev[lb]
+
+
+@functools.lru_cache(maxsize=8)
+def _substitution_matrix(groups_key):
+    """Dense substitution matrix for a frozen groups mapping (cached)."""
+    groups = dict(groups_key) if groups_key is not None else None
+    return build_substitution_matrix(groups)
+
+
+def _frozen_groups(config):
+    """Hashable cache key for config.phonetic_groups."""
+    groups = config.phonetic_groups
+    if groups is None:
+        return None
+    return tuple((name, tuple(members)) for name, members in groups.items())
+
+
+def calculate_phonetic_similarity(enc1, enc2, speaker1=None, speaker2=None,
+                                  speaker_mismatch_penalty=0.0, sub_costs=None):
+    """
+    Normalized phonetic similarity between two encoded phoneme sequences.
+
+    With a substitution-cost matrix, the distance weighs same-group phoneme
+    substitutions at reduced cost; without one, it dispatches to the fastest
+    available uniform-cost Levenshtein kernel (numba-compiled, then the
+    python-Levenshtein C extension, then pure Python).
+
+    Args:
+        enc1: First encoded phoneme sequence
+        enc2: Second encoded phoneme sequence
+        speaker1: Speaker of the first chunk, if known
+        speaker2: Speaker of the second chunk, if known
+        speaker_mismatch_penalty: Penalty subtracted when speakers differ
+        sub_costs: Optional substitution-cost matrix indexed by phoneme id
+
+    Returns:
+        Similarity in [0.0, 1.0]; 1.0 means identical phoneme sequences
+    """
+    longest = max(len(enc1), len(enc2))
+    if longest == 0:
+        return 0.0
+    if sub_costs is not None:
+        distance = _weighted_levenshtein(enc1, enc2, sub_costs)
+    else:
+        distance = _levenshtein(enc1, enc2)
+    score = 1.0 - distance / longest
+    if (speaker_mismatch_penalty > 0.0 and speaker1 and speaker2
+            and speaker1 != speaker2):
+        score -= speaker_mismatch_penalty
+    return score if score > 0.0 else 0.0
+
+
+def _intern_speakers(speakers1, speakers2):
+    """
+    Map both sets' speaker names to small ids shared across the sets.
+
+    Absent speakers become -1, so a mismatch test in the hot path is two
+    sign checks and an int compare instead of string equality.
+    """
+    table = {}
+
+    def _ids(speakers):
+        ids = []
+        append = ids.append
+        get = table.get
+        for name in speakers:
+            if not name:
+                append(-1)
+                continue
+            sid = get(name)
+            if sid is None:
+                sid = len(table)
+                table[name] = sid
+            append(sid)
+        return ids
+
+    return _ids(speakers1), _ids(speakers2)
+
+
+def _make_similarity_scorer(encoded1, speakers1, encoded2, speakers2, penalty,
+                            sub_costs=None):
+    """
+    Build a memoized (i, j) -> similarity scorer for one align call.
+
+    The anchor search and the walk re-score the same chunk pairs (window
+    overlap, gap retries), and generated subtitle sets repeat phoneme
+    sequences outright. Each distinct sequence is interned to a small id
+    once up front, so a repeat scoring costs one dict probe on an
+    (id, id, mismatch) key instead of a full Levenshtein pass. Speakers
+    are likewise interned to shared ids, so the per-pair mismatch test
+    compares ints rather than strings.
+    """
+    seq_ids = {}
+
+    def _intern(sequences):
+        ids = []
+        append = ids.append
+        for seq in sequences:
+            key = bytes(seq)
+            sid = seq_ids.get(key)
+            if sid is None:
+                sid = len(seq_ids)
+                seq_ids[key] = sid
+            append(sid)
+        return ids
+
+    ids1 = _intern(encoded1)
+    ids2 = _intern(encoded2)
+    spk1, spk2 = _intern_speakers(speakers1, speakers2)
+    penalize = penalty > 0.0
+    cache = {}
+
+    def score(i, j):
+        s1, s2 = spk1[i], spk2[j]
+        mismatch = penalize and s1 >= 0 and s2 >= 0 and s1 != s2
+        key = (ids1[i], ids2[j], mismatch)
+        cached = cache.get(key)
+        if cached is None:
+            cached = calculate_phonetic_similarity(
+                encoded1[i], encoded2[j], sub_costs=sub_costs
+            )
+            if mismatch:
+                cached -= penalty
+                if cached < 0.0:
+                    cached = 0.0
+            cache[key] = cached
+        return cached
+
+    # Carried so smear merging can score concatenated sequences that are
+    # not in the interned table
+    score.penalty = penalty
+    score.sub_costs = sub_costs
+    return score
+
+
+# Number of leading Set 1 chunks probed when searching for the anchor
+_ANCHOR_PROBES = 10
+
+# Bin width for the coarse activation vectors, and the fine window searched
+# around the coarse offset estimate
+_COARSE_RESOLUTION = 0.1
+_COARSE_FINE_WINDOW = 2.0
+
+
+def estimate_coarse_offset(starts1, starts2, resolution=_COARSE_RESOLUTION):
+    """
+    Cheap whole-set estimate of the Set 2 minus Set 1 time offset.
+
+    With numpy, both sets are rasterized into subtitle-activation vectors
+    and cross-correlated via FFT in O((N+M) log(N+M)); the best lag is the
+    coarse offset, which lets the anchor search probe a narrow window
+    instead of the full initial_search_window_seconds. Without numpy, the
+    median of index-paired start differences serves as the estimate.
+
+    Returns:
+        Estimated offset in seconds, or None when either set is empty
+    """
+    if not len(starts1) or not len(starts2):
+        return None
+
+    if np is not None:
+        s1 = np.asarray(starts1, dtype=np.float64)
+        s2 = np.asarray(starts2, dtype=np.float64)
+        t0 = min(s1[0], s2[0])
+        bins1 = ((s1 - t0) / resolution).astype(np.intp)
+        bins2 = ((s2 - t0) / resolution).astype(np.intp)
+        length = int(max(bins1[-1], bins2[-1])) + 1
+        v1 = np.zeros(length)
+        v2 = np.zeros(length)
+        np.add.at(v1, bins1, 1.0)
+        np.add.at(v2, bins2, 1.0)
+
+        # Circular cross-correlation via FFT; lags past n//2 wrap negative
+        n = 1 << (2 * length - 1).bit_length()
+        corr = np.fft.irfft(
+            np.fft.rfft(v2, n) * np.conj(np.fft.rfft(v1, n)), n
+        )
+        lag = int(np.argmax(corr))
+        if lag > n // 2:
+            lag -= n
+        return lag * resolution
+
+    import statistics
+
+    paired = min(len(starts1), len(starts2))
+    return statistics.median(
+        starts2[k] - starts1[k] for k in range(paired)
+    )
+
+
+def find_initial_anchor(encoded1, starts1, speakers1, encoded2, starts2,
+                        speakers2, config, score=None, coarse_offset=None):
+    """
+    Find the first high-confidence match to seed the walk.
+
+    Probes the first few Set 1 chunks against every Set 2 chunk whose start
+    time falls within the search window, and returns the best pair over the
+    similarity threshold. When a coarse offset estimate is supplied, the
+    window narrows to a few seconds around it, which typically scores a
+    small fraction of the full-window candidate set.
+
+    Args:
+        score: Optional memoized (i, j) scorer from _make_similarity_scorer;
+            built on the fly when omitted
+        coarse_offset: Optional Set 2 minus Set 1 offset estimate from
+            estimate_coarse_offset
+
+    Returns:
+        (i, j, score) of the anchor, or None when nothing clears the
+        threshold
+    """
+    from bisect import bisect_left, bisect_right
+
+    if score is None:
+        score = _make_similarity_scorer(
+            encoded1, speakers1, encoded2, speakers2,
+            config.speaker_mismatch_penalty,
+            _substitution_matrix(_frozen_groups(config))
+        )
+    if coarse_offset is None:
+        center, window = 0.0, config.initial_search_window_seconds
+    else:
+        center, window = coarse_offset, _COARSE_FINE_WINDOW
+    threshold = config.phonetic_similarity_threshold
+    best = None
+    best_score = -1.0
+
+    for i in range(min(_ANCHOR_PROBES, len(encoded1))):
+        t = starts1[i] + center
+        lo = bisect_left(starts2, t - window)
+        hi = bisect_right(starts2, t + window)
+        for j in range(lo, hi):
+            pair_score = score(i, j)
+            # Strict > keeps the earliest pair on ties, leaving the most
+            # room for the walk that follows
+            if pair_score >= threshold and pair_score > best_score:
+                best = (i, j, pair_score)
+                best_score = pair_score
+    return best
+
+
+def _concat(enc_a, enc_b):
+    """Concatenate two encoded phoneme sequences (bytes or uint8 arrays)."""
+    if np is not None and isinstance(enc_a, np.ndarray):
+        return np.concatenate((enc_a, enc_b))
+    return enc_a + enc_b
+
+
+@functools.lru_cache(maxsize=8)
+def _specialized_step(i_steps, j_steps, threshold, smear_threshold):
+    """
+    Build a walk-step function specialized for one config.
+
+    The neighborhood shape and both thresholds are constants for the
+    duration of an align call but were re-read from the config at every
+    step. Binding them as closure constants (and the step tuples as local
+    iterables) removes those per-cell attribute and dict lookups; the
+    closures are cached per distinct parameter set, so repeated align calls
+    with the same config reuse one function object.
+
+    Returns:
+        step(current_i, current_j, encoded1, speakers1, encoded2,
+        speakers2, score) classifying the best move as
+        ('direct', ni, nj, score) for a match over the similarity threshold,
+        ('smear', ni, [nj, nj+1], score) when the next Set 1 chunk matches
+        two merged Set 2 chunks, or ('gap', -1, -1, best_score) otherwise
+    """
+
+    def step(current_i, current_j, encoded1, speakers1, encoded2, speakers2,
+             score):
+        # Direct matching and smear detection share the same candidate
+        # scores from a single traversal, instead of re-scanning the
+        # neighborhood in a separate detect_smearing pass
+        m, n = len(encoded1), len(encoded2)
+        candidates = {}
+        best_i = best_j = -1
+        best_score = -1.0
+        for di in i_steps:
+            ni = current_i + di
+            if ni >= m:
+                continue
+            for dj in j_steps:
+                nj = current_j + dj
+                if nj >= n:
+                    continue
+                pair_score = score(ni, nj)
+                candidates[(ni, nj)] = pair_score
+                if pair_score > best_score:
+                    best_i, best_j, best_score = ni, nj, pair_score
+
+        if best_score >= threshold:
+            return 'direct', best_i, best_j, best_score
+
+        # Signal smearing: the next Set 1 chunk may span two adjacent Set 2
+        # chunks. When both halves score moderately, compare against their
+        # merged phonemes, reusing the candidate scores from the pass above.
+        ni, j1, j2 = current_i + 1, current_j + 1, current_j + 2
+        if ni < m and j2 < n:
+            half1 = candidates.get((ni, j1))
+            half2 = candidates.get((ni, j2))
+            if (half1 is not None and half1 >= smear_threshold
+                    and half2 is not None and half2 >= smear_threshold):
+                merged_score = calculate_phonetic_similarity(
+                    encoded1[ni], _concat(encoded2[j1], encoded2[j2]),
+                    speakers1[ni], speakers2[j1],
+                    getattr(score, 'penalty', 0.0),
+                    getattr(score, 'sub_costs', None)
+                )
+                if merged_score >= threshold:
+                    return 'smear', ni, [j1, j2], merged_score
+
+        return 'gap', -1, -1, best_score
+
+    return step
+
+
+def _step_for(config):
+    """The cached specialized step function for config."""
+    neighborhood = config.local_search_neighborhood
+    return _specialized_step(
+        tuple(neighborhood['i_steps']), tuple(neighborhood['j_steps']),
+        config.phonetic_similarity_threshold,
+        config.smear_similarity_threshold
+    )
+
+
+def _expand_step(current_i, current_j, encoded1, speakers1, encoded2,
+                 speakers2, score, config):
+    """Score the local neighborhood once and classify the best move."""
+    return _step_for(config)(
+        current_i, current_j, encoded1, speakers1, encoded2, speakers2, score
+    )
+
+
+def follow_alignment_path(encoded1, speakers1, encoded2, speakers2, anchor,
+                          config, score=None):
+    """
+    Extend the alignment path from the anchor by walking the local
+    neighborhood.
+
+    Each step scores the configured (di, dj) candidates exactly once via
+    _expand_step: the best candidate is taken when it clears the similarity
+    threshold, a smeared match consumes two merged Set 2 chunks, and
+    otherwise a gap is recorded until max_consecutive_gaps is exhausted.
+
+    Args:
+        score: Optional memoized (i, j) scorer from _make_similarity_scorer;
+            built on the fly when omitted
+
+    Returns:
+        (path, path_score) where path entries are (i, j) pairs, with j a
+        list of merged indices for smeared matches
+    """
+    i0, j0, score0 = anchor
+    m, n = len(encoded1), len(encoded2)
+    if score is None:
+        score = _make_similarity_scorer(
+            encoded1, speakers1, encoded2, speakers2,
+            config.speaker_mismatch_penalty,
+            _substitution_matrix(_frozen_groups(config))
+        )
+
+    path = [(i0, j0)]
+    path_score = score0
+    current_i, current_j = i0, j0
+    consecutive_gaps = 0
+    step = _step_for(config)
+    max_gaps = config.max_consecutive_gaps
+    gap_penalty = config.gap_penalty
+
+    while current_i < m - 1 and current_j < n - 1:
+        kind, next_i, next_j, step_score = step(
+            current_i, current_j, encoded1, speakers1, encoded2, speakers2,
+            score
+        )
+
+        if kind == 'direct':
+            path.append((next_i, next_j))
+            current_i, current_j = next_i, next_j
+            path_score += step_score
+            consecutive_gaps = 0
+        elif kind == 'smear':
+            path.append((next_i, next_j))
+            current_i, current_j = next_i, next_j[-1]
+            path_score += step_score
+            consecutive_gaps = 0
+        elif consecutive_gaps < max_gaps:
+            consecutive_gaps += 1
+            path_score -= gap_penalty
+            current_i += 1
+            current_j += 1
+        else:
+            break
+
+    return path, path_score
+
+
+def calculate_offset(path, starts1, starts2):
+    """
+    Median offset and its spread across the path.
+
+    Args:
+        path: list of (i, j) index pairs; smeared entries carry a list of
+            j indices, of which the first anchors the offset
+        starts1: Set 1 start times
+        starts2: Set 2 start times
+
+    Returns:
+        (median_offset, standard_deviation)
+    """
+    if np is not None:
+        # Gather both index columns and let numpy do the subtraction,
+        # median and spread in C over the whole path at once
+        i_idx = np.fromiter(
+            (i for i, _ in path), dtype=np.intp, count=len(path)
+        )
+        j_idx = np.fromiter(
+            ((j if isinstance(j, int) else j[0]) for _, j in path),
+            dtype=np.intp, count=len(path)
+        )
+        offsets = (np.asarray(starts2, dtype=np.float64)[j_idx]
+                   - np.asarray(starts1, dtype=np.float64)[i_idx])
+        return float(np.median(offsets)), float(offsets.std())
+
+    import statistics
+
+    offsets = [
+        starts2[j if isinstance(j, int) else j[0]] - starts1[i]
+        for i, j in path
+    ]
+    median = statistics.median(offsets)
+    sd = statistics.pstdev(offsets) if len(offsets) > 1 else 0.0
+    return median, sd
+
+
+def walk_align(subtitles1, subtitles2,
+               config: Optional[AlignmentConfig] = None) -> AlignmentResult:
+    """
+    Align two normalized subtitle sets with the reference Phonetic Walk.
+
+    Args:
+        subtitles1: First set of normalized subtitle dictionaries
+        subtitles2: Second set of normalized subtitle dictionaries
+        config: Optional configuration parameters
+
+    Returns:
+        An AlignmentResult with the computed offset, or a failure with
+        reason 'no_anchor_found', 'path_too_short' or 'offset_inconsistent'
+    """
+    if config is None:
+        config = AlignmentConfig()
+    if not subtitles1 or not subtitles2:
+        return AlignmentResult.failure('no_anchor_found')
+
+    encoded1, starts1, speakers1 = _encode_set(subtitles1)
+    encoded2, starts2, speakers2 = _encode_set(subtitles2)
+
+    # One memoized scorer shared by the anchor search and the walk, scoring
+    # with the config's substitution-cost matrix
+    score = _make_similarity_scorer(
+        encoded1, speakers1, encoded2, speakers2,
+        config.speaker_mismatch_penalty,
+        _substitution_matrix(_frozen_groups(config))
+    )
+
+    # Narrow the anchor search around a coarse whole-set offset estimate,
+    # falling back to the full window when nothing is found there
+    coarse_offset = estimate_coarse_offset(starts1, starts2)
+    anchor = find_initial_anchor(
+        encoded1, starts1, speakers1, encoded2, starts2, speakers2, config,
+        score=score, coarse_offset=coarse_offset
+    )
+    if anchor is None and coarse_offset is not None:
+        anchor = find_initial_anchor(
+            encoded1, starts1, speakers1, encoded2, starts2, speakers2,
+            config, score=score
+        )
+    if anchor is None:
+        return AlignmentResult.failure('no_anchor_found')
+
+    path, path_score = follow_alignment_path(
+        encoded1, speakers1, encoded2, speakers2, anchor, config, score=score
+    )
+    if len(path) < config.min_path_length:
+        return AlignmentResult.failure('path_too_short')
+
+    median_offset, sd = calculate_offset(path, starts1, starts2)
+    if sd > config.offset_consistency_threshold_sd:
+        return AlignmentResult.failure('offset_inconsistent')
+
+    # Confidence blends average per-step similarity with offset tightness
+    avg_similarity = max(0.0, min(1.0, path_score / len(path)))
+    confidence = avg_similarity / (1.0 + sd)
+    return AlignmentResult.success(median_offset, confidence, path)
@@ -0,0 +1,134 @@
+
+"""
+Fixed Phoneme Alphabet and Compact Encoding
+
+The interface stores phonemes as list[str], which is convenient but hostile
+to fast alignment kernels: every comparison is a Python string equality and
+every reference costs a pointer. Since the ARPABET alphabet has only 39
+symbols, each phoneme fits comfortably in a uint8. This module defines the
+canonical alphabet and a helper that encodes a phoneme sequence into a
+compact id array, which alignment implementations can compare with byte
+(or SIMD, via numpy/numba) operations and which shrinks DP-matrix memory
+traffic roughly 8x versus string references.
+"""
+
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# The 39 ARPABET phonemes, in conventional order. Index in this tuple is the
+# phoneme's id; ids are stable across runs because the tuple is a constant.
+PHONEME_ALPHABET: tuple[str, ...] = (
+    'AA', 'AE', 'AH', 'AO', 'AW', 'AY',
+    'B', 'CH', 'D', 'DH',
+    'EH', 'ER', 'EY',
+    'F', 'G', 'HH',
+    'IH', 'IY',
+    'JH', 'K', 'L', 'M', 'N', 'NG',
+    'OW', 'OY',
+    'P', 'R', 'S', 'SH',
+    'T', 'TH',
+    'UH', 'UW',
+    'V', 'W', 'Y', 'Z', 'ZH'
+)
+
+_PH2ID: dict[str, int] = {phoneme: i for i, phoneme in enumerate(PHONEME_ALPHABET)}
+
+# Default articulatory grouping: substituting within a group is half the
+# cost of substituting across groups, so acoustically confusable phonemes
+# (the usual transcription errors) stay cheap to align
+PHONETIC_GROUPS: dict[str, tuple[str, ...]] = {
+    'vowels': ('AA', 'AE', 'AH', 'AO', 'AW', 'AY', 'EH', 'ER', 'EY',
+               'IH', 'IY', 'OW', 'OY', 'UH', 'UW'),
+    'stops': ('B', 'D', 'G', 'K', 'P', 'T'),
+    'fricatives': ('DH', 'F', 'HH', 'S', 'SH', 'TH', 'V', 'Z', 'ZH'),
+    'affricates': ('CH', 'JH'),
+    'nasals': ('M', 'N', 'NG'),
+    'liquids': ('L', 'R'),
+    'glides': ('W', 'Y'),
+}
+
+# Substitution cost within an articulatory group (identical phonemes cost 0,
+# cross-group substitutions cost 1)
+_GROUP_SUBSTITUTION_COST = 0.5
+
+
+def build_substitution_matrix(groups=None):
+    """
+    Build a dense phoneme-id substitution-cost matrix.
+
+    Scoring kernels index the result as matrix[id1][id2] — one contiguous
+    load per cell instead of a hashed pair lookup. Costs are 0.0 on the
+    diagonal, _GROUP_SUBSTITUTION_COST within an articulatory group, and
+    1.0 across groups.
+
+    Args:
+        groups: Mapping of group name to phoneme sequence; defaults to
+            PHONETIC_GROUPS
+
+    Returns:
+        A float32 numpy matrix when numpy is installed, otherwise a tuple
+        of row tuples (both index the same way)
+    """
+    if groups is None:
+        groups = PHONETIC_GROUPS
+
+    group_of = {}
+    for name, members in groups.items():
+        for phoneme in members:
+            group_of[_PH2ID[phoneme]] = name
+
+    n = len(PHONEME_ALPHABET)
+    rows = []
+    for a in range(n):
+        group_a = group_of.get(a)
+        row = []
+        for b in range(n):
+            if a == b:
+                row.append(0.0)
+            elif group_a is not None and group_a == group_of.get(b):
+                row.append(_GROUP_SUBSTITUTION_COST)
+            else:
+                row.append(1.0)
+        rows.append(row)
+
+    if np is not None:
+        return np.array(rows, dtype=np.float32)
+    return tuple(tuple(row) for row in rows)
+
+
+def encode_phonemes(phonemes: list[str]) -> Any:
+    """
+    Encode a phoneme sequence as a compact uint8 id array.
+
+    Args:
+        phonemes: list of phoneme strings drawn from PHONEME_ALPHABET
+
+    Returns:
+        A numpy uint8 array of phoneme ids when numpy is installed,
+        otherwise a bytes object with the same values
+
+    Raises:
+        KeyError: If a phoneme is not in PHONEME_ALPHABET
+    """
+    if np is not None:
+        return np.fromiter(
+            (_PH2ID[p] for p in phonemes), dtype=np.uint8, count=len(phonemes)
+        )
+    return bytes(_PH2ID[p] for p in phonemes)
+
+
+def decode_phonemes(phoneme_ids) -> list[str]:
+    """
+    Decode a uint8 id array (or bytes) back into phoneme strings.
+
+    Args:
+        phoneme_ids: Sequence of phoneme ids produced by encode_phonemes
+
+    Returns:
+        list of phoneme strings
+    """
+    return [PHONEME_ALPHABET[i] for i in phoneme_ids]
@@ -0,0 +1,196 @@
+
+"""
+Struct-of-Arrays Subtitle Table
+
+The interface passes subtitle sets as list[dict], which costs a hash lookup
+and a boxed value per field per entry in hot loops. SubtitleTable stores a
+whole set as parallel columns instead: numeric fields become numpy arrays
+when numpy is installed, phonemes are flattened into one contiguous id
+array addressed by an offsets column, and speakers are interned to small
+ids. from_dicts/to_dicts convert at the boundary, so dict-based
+implementations keep working while alignment kernels can consume columns.
+"""
+
+from dataclasses import dataclass, replace
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .phoneme_alphabet import PHONEME_ALPHABET, _PH2ID
+
+# Id for phonemes outside PHONEME_ALPHABET (kept distinct from every real id)
+_UNKNOWN_ID = 255
+
+
+@dataclass(slots=True)
+class SubtitleTable:
+    """
+    Columnar view of a normalized subtitle set.
+
+    Attributes:
+        ids: Entry ids, one per subtitle
+        starts: Start times in seconds
+        ends: End times in seconds
+        texts: Text content per subtitle
+        speaker_ids: Interned speaker id per subtitle (-1 when absent)
+        speaker_names: Distinct speaker names, indexed by speaker id
+        phoneme_ids: All phoneme ids, flattened across the set
+        phoneme_offsets: Index of each subtitle's first phoneme in
+            phoneme_ids; entry i owns phoneme_ids[offsets[i]:offsets[i+1]]
+    """
+
+    ids: Any
+    starts: Any
+    ends: Any
+    texts: list
+    speaker_ids: Any
+    speaker_names: list
+    phoneme_ids: Any
+    phoneme_offsets: Any
+
+    @classmethod
+    def from_dicts(cls, subtitles: list[dict[str, Any]]) -> 'SubtitleTable':
+        """
+        Build a table from normalized subtitle dictionaries.
+
+        Args:
+            subtitles: list of normalized subtitle dictionaries
+
+        Returns:
+            A SubtitleTable with one row per input subtitle
+        """
+        return cls.from_iter(subtitles)
+
+    @classmethod
+    def from_iter(cls, subtitles) -> 'SubtitleTable':
+        """
+        Build a table by consuming an iterable of normalized subtitles.
+
+        Pairs with wrangler_interface.iter_subtitles: a large subtitle file
+        streams straight into the columns in one pass, without an
+        intermediate list of dicts ever existing. Peak memory is the
+        columns themselves plus one in-flight subtitle.
+
+        Args:
+            subtitles: Iterable of normalized subtitle dictionaries
+
+        Returns:
+            A SubtitleTable with one row per input subtitle
+        """
+        ids = []
+        starts = []
+        ends = []
+        texts = []
+        speaker_ids = []
+        speaker_to_id = {}
+        speaker_names = []
+        phoneme_ids = []
+        phoneme_offsets = [0]
+
+        get_phoneme_id = _PH2ID.get
+        for subtitle in subtitles:
+            ids.append(subtitle.get('id'))
+            starts.append(float(subtitle['start']))
+            ends.append(float(subtitle['end']))
+            texts.append(subtitle.get('text'))
+
+            speaker = subtitle.get('speaker')
+            if speaker:
+                sid = speaker_to_id.get(speaker)
+                if sid is None:
+                    sid = len(speaker_names)
+                    speaker_to_id[speaker] = sid
+                    speaker_names.append(speaker)
+                speaker_ids.append(sid)
+            else:
+                speaker_ids.append(-1)
+
+            for phoneme in subtitle.get('phonemes') or ():
+                phoneme_ids.append(get_phoneme_id(phoneme, _UNKNOWN_ID))
+            phoneme_offsets.append(len(phoneme_ids))
+
+        if np is not None:
+            ids = np.asarray(ids, dtype=np.int64)
+            starts = np.asarray(starts, dtype=np.float64)
+            ends = np.asarray(ends, dtype=np.float64)
+            speaker_ids = np.asarray(speaker_ids, dtype=np.int16)
+            phoneme_ids = np.asarray(phoneme_ids, dtype=np.uint8)
+            phoneme_offsets = np.asarray(phoneme_offsets, dtype=np.int64)
+
+        return cls(
+            ids=ids, starts=starts, ends=ends, texts=texts,
+            speaker_ids=speaker_ids, speaker_names=speaker_names,
+            phoneme_ids=phoneme_ids, phoneme_offsets=phoneme_offsets
+        )
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def apply_offset(self, offset_seconds: float,
+                     mutate: bool = False) -> 'SubtitleTable':
+        """
+        Shift all timestamps by offset_seconds.
+
+        With numpy this is two vectorized adds over the whole set; the other
+        columns are shared with the source table rather than copied.
+
+        Args:
+            offset_seconds: Time offset to apply in seconds
+            mutate: Shift this table in place instead of returning a
+                shifted copy
+
+        Returns:
+            The shifted table (self when mutate is True)
+        """
+        if mutate:
+            if np is not None:
+                self.starts += offset_seconds
+                self.ends += offset_seconds
+            else:
+                self.starts = [s + offset_seconds for s in self.starts]
+                self.ends = [e + offset_seconds for e in self.ends]
+            return self
+        if np is not None:
+            starts = self.starts + offset_seconds
+            ends = self.ends + offset_seconds
+        else:
+            starts = [s + offset_seconds for s in self.starts]
+            ends = [e + offset_seconds for e in self.ends]
+        return replace(self, starts=starts, ends=ends)
+
+    def phonemes_of(self, i: int):
+        """Encoded phoneme ids of entry i (a slice of the flat column)."""
+        return self.phoneme_ids[self.phoneme_offsets[i]:self.phoneme_offsets[i + 1]]
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """
+        Rebuild the list-of-dicts form.
+
+        Phonemes are decoded from their ids, so symbols outside
+        PHONEME_ALPHABET come back as the placeholder '??'.
+
+        Returns:
+            list of subtitle dictionaries, speaker omitted where absent
+        """
+        alphabet_size = len(PHONEME_ALPHABET)
+        subtitles = []
+        for i in range(len(self.texts)):
+            encoded = self.phonemes_of(i)
+            subtitle = {
+                'id': int(self.ids[i]) if self.ids[i] is not None else None,
+                'start': float(self.starts[i]),
+                'end': float(self.ends[i]),
+                'text': self.texts[i],
+                'phonemes': [
+                    PHONEME_ALPHABET[p] if p < alphabet_size else '??'
+                    for p in encoded
+                ],
+            }
+            sid = self.speaker_ids[i]
+            if sid >= 0:
+                subtitle['speaker'] = self.speaker_names[sid]
+            subtitles.append(subtitle)
+        return subtitles
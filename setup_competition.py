@@ -6,12 +6,35 @@ This script sets up the competition directories by copying schemas and sample da
 to each AI competitor directory.
 """
 
+import functools
 import os
+import sys
 import shutil
 import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # non-POSIX
+    fcntl = None
+
+# Resolved once at import time; the sample-data fallback used to re-run the
+# import machinery (sys.path scan included) on every call
+try:
+    import data_generator
+except ImportError:
+    data_generator = None
+
+# shutil's default copy buffer is 64 KiB on POSIX; 1 MiB cuts the number of
+# read/write round-trips for the shutil.copy2 fallback path considerably
+shutil.COPY_BUFSIZE = 1024 * 1024
+
+# Linux FICLONE ioctl: share the source's extents with the destination
+# (btrfs/XFS reflink) instead of copying them
+_FICLONE = 0x40049409
+
 # AI competitor directories
 AI_DIRS = [
     "ai-augment",
@@ -21,10 +44,233 @@ AI_DIRS = [
     "ai-plandex-strong"
 ]
 
-def create_directories():
-    """Create the AI competitor directories if they don't exist."""
+# Files copied into every AI competitor directory
+DATA_FILES = [
+    "set1-schema.json",
+    "set1-subtitles.json",
+    "set2-schema.json",
+    "set2-subtitles.json"
+]
+DOC_FILES = ["README.md", "ALGORITHM.md", "instructions_and_tips.md"]
+SOLUTION_FILES = ["wrangler.py", "alignment.py"]
+EVALUATION_SCRIPTS = [
+    "evaluate_wrangler.py",
+    "evaluate_alignment.py",
+    "evaluate_end_to_end.py"
+]
+
+@functools.lru_cache(maxsize=None)
+def _present_data_files(data_dir):
+    """
+    The data files present in data_dir, checked once per run.
+
+    The same sources are copied into every AI directory, so the existence
+    stat (and the missing-file warning) happens once per source instead of
+    once per source per directory.
+    """
+    present = []
+    for filename in DATA_FILES:
+        src_file = os.path.join(data_dir, filename)
+        if os.path.exists(src_file):
+            present.append((filename, src_file))
+        else:
+            print(f"Warning: {src_file} not found. Skipping.")
+    return tuple(present)
+
+@functools.lru_cache(maxsize=1)
+def _present_doc_files():
+    """The documentation files present in the repo root, checked once."""
+    present = []
+    for filename in DOC_FILES:
+        if os.path.exists(filename):
+            present.append(filename)
+        else:
+            print(f"Warning: {filename} not found. Skipping.")
+    return tuple(present)
+
+@functools.lru_cache(maxsize=1)
+def _present_evaluation_scripts():
+    """The evaluation scripts present in the repo root, checked once."""
+    present = []
+    for script in EVALUATION_SCRIPTS:
+        if os.path.exists(script):
+            present.append(script)
+        else:
+            print(f"Warning: {script} not found. Skipping.")
+    return tuple(present)
+
+def _needs_copy(src, dst):
+    """
+    Whether dst is missing or stale relative to src.
+
+    Compares size and mtime (which shutil.copy2 and hardlinks both
+    preserve), so a re-run over an already-populated tree costs two stat
+    calls per file instead of a read and rewrite.
+    """
+    try:
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        return True
+    return (src_stat.st_size != dst_stat.st_size
+            or src_stat.st_mtime_ns > dst_stat.st_mtime_ns)
+
+def _reflink(src, dst):
+    """
+    Clone src's extents onto dst (CoW reflink); True on success.
+
+    Like a hardlink this is an O(1) metadata operation regardless of file
+    size, but the destination is an independent file, so it also covers
+    the unlink-and-retry cases where a hardlink was refused.
+    """
+    if fcntl is None:
+        return False
+    tmp = dst + ".tmp"
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+        finally:
+            os.close(dst_fd)
+    except OSError:
+        # Filesystem without reflink support; remove the truncated stub
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        return False
+    finally:
+        os.close(src_fd)
+    shutil.copystat(src, tmp)
+    os.replace(tmp, dst)
+    return True
+
+def _copy_bytes(src, dst):
+    """
+    Copy file bytes in kernel space where the platform allows it.
+
+    os.copy_file_range (and os.sendfile as second choice) moves the data
+    without round-tripping it through a userspace buffer; on CoW
+    filesystems copy_file_range can reflink instead of copying at all.
+    shutil.copy2 remains the portable fallback. Metadata is preserved to
+    match copy2, which _needs_copy relies on. Bytes land in a sibling
+    .tmp file that is renamed over dst only once complete, so a killed
+    run never leaves a half-written destination behind.
+    """
+    tmp = dst + ".tmp"
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        size = os.fstat(src_fd).st_size
+        dst_fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if hasattr(os, 'copy_file_range'):
+                try:
+                    remaining = size
+                    while remaining > 0:
+                        sent = os.copy_file_range(src_fd, dst_fd, remaining)
+                        if sent == 0:
+                            break
+                        remaining -= sent
+                    if remaining == 0:
+                        shutil.copystat(src, tmp)
+                        os.replace(tmp, dst)
+                        return
+                except OSError:
+                    os.lseek(src_fd, 0, os.SEEK_SET)
+                    os.lseek(dst_fd, 0, os.SEEK_SET)
+                    os.ftruncate(dst_fd, 0)
+            if hasattr(os, 'sendfile'):
+                try:
+                    offset = 0
+                    while offset < size:
+                        sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+                    if offset == size:
+                        shutil.copystat(src, tmp)
+                        os.replace(tmp, dst)
+                        return
+                except OSError:
+                    pass
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    shutil.copy2(src, tmp)
+    os.replace(tmp, dst)
+
+def _fast_copy(src, dst):
+    """
+    Copy src to dst, hardlinking instead when possible.
+
+    On the same filesystem a hardlink is a single inode-metadata operation
+    rather than a read and rewrite of the file bytes. Cross-device or
+    otherwise refused links fall back to a kernel-space byte copy.
+    Destinations that already match src by size and mtime are left alone.
+    """
+    if not _needs_copy(src, dst):
+        return
+    try:
+        os.link(src, dst)
+        return
+    except FileExistsError:
+        if os.path.samefile(src, dst):
+            return
+        os.unlink(dst)
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+    except OSError:
+        pass
+    if _reflink(src, dst):
+        return
+    _copy_bytes(src, dst)
+
+def _private_copy(src, dst):
+    """
+    Copy src to dst without ever sharing an inode between them.
+
+    The hand-out files (_fast_copy) are read-only and clobbered on re-run,
+    so aliasing them via hardlink is safe. Solution files are the opposite:
+    competitors edit them in place, and a hardlinked destination would
+    write through to the shared template (or a sibling's live solution).
+    Reflinks are still fine — they share extents copy-on-write, not the
+    inode — so this skips straight to the reflink/byte-copy rungs.
+    """
+    if not _needs_copy(src, dst):
+        return
+    if _reflink(src, dst):
+        return
+    _copy_bytes(src, dst)
+
+def create_directories(data_dir="data"):
+    """
+    Create every directory the setup will need, shallow to deep.
+
+    Each os.makedirs call re-stats all path components, and the copy
+    helpers used to repeat it per subdirectory. Planning the full set up
+    front and issuing one plain mkdir per directory (sorted so parents
+    come first) cuts the metadata syscalls to one per directory.
+    """
+    needed = {data_dir}
+    for ai_dir in AI_DIRS:
+        needed.add(ai_dir)
+        needed.add(os.path.join(ai_dir, "data"))
+        needed.add(os.path.join(ai_dir, "interfaces"))
+        needed.add(os.path.join(ai_dir, "solutions"))
+    for path in sorted(needed, key=lambda p: p.count(os.sep)):
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            # Nested data_dir: fall back to creating the parents too
+            os.makedirs(path, exist_ok=True)
     for ai_dir in AI_DIRS:
-        os.makedirs(ai_dir, exist_ok=True)
         print(f"Created directory: {ai_dir}")
 
 def copy_schemas_and_data(data_dir="data"):
@@ -34,35 +280,67 @@ def copy_schemas_and_data(data_dir="data"):
     Args:
         data_dir: Directory containing the schemas and sample data
     """
+    _ensure_sample_data(data_dir)
+
+    # Copy schemas and sample data to each AI competitor directory
+    for ai_dir in AI_DIRS:
+        _copy_data_for(ai_dir, data_dir)
+
+# Parameters the sample data is generated with; recorded in the data dir's
+# manifest so regeneration triggers when they change, not just when files
+# go missing
+GENERATION_PARAMS = {"num_entries": 30, "offset": 3.5, "include_challenges": True}
+
+def _ensure_sample_data(data_dir):
+    """
+    Generate sample data in data_dir if it is missing or out of date.
+
+    A .manifest.json alongside the data records the generation parameters,
+    so editing GENERATION_PARAMS regenerates stale data that a bare
+    existence check would have trusted. Data without a manifest (from
+    runs predating it) is assumed current and just gains one.
+    """
     # Create data directory if it doesn't exist
     os.makedirs(data_dir, exist_ok=True)
+    manifest_path = os.path.join(data_dir, ".manifest.json")
+
+    recorded = None
+    try:
+        with open(manifest_path) as f:
+            recorded = json.load(f).get("params")
+    except (OSError, ValueError):
+        pass
+
+    have_data = os.path.exists(os.path.join(data_dir, "set1-schema.json"))
+    if have_data and recorded is not None and recorded == GENERATION_PARAMS:
+        return
 
-    # Generate sample data if it doesn't exist
-    if not os.path.exists(os.path.join(data_dir, "set1-schema.json")):
+    if not have_data:
         print("Sample data not found. Generating sample data...")
-        try:
-            import data_generator
-            data_generator.generate_test_data(data_dir, num_entries=30, offset=3.5, include_challenges=True)
-        except ImportError:
+    elif recorded is not None:
+        print("Sample data was generated with different parameters. Regenerating...")
+
+    if data_generator is None:
+        if not have_data:
             print("Warning: data_generator.py not found. Skipping sample data generation.")
+        return
 
-    # Copy schemas and sample data to each AI competitor directory
-    for ai_dir in AI_DIRS:
-        # Create data subdirectory in each AI directory
-        ai_data_dir = os.path.join(ai_dir, "data")
-        os.makedirs(ai_data_dir, exist_ok=True)
-
-        # Copy schema and sample data files
-        for filename in ["set1-schema.json", "set1-subtitles.json",
-                         "set2-schema.json", "set2-subtitles.json"]:
-            src_file = os.path.join(data_dir, filename)
-            dst_file = os.path.join(ai_data_dir, filename)
-
-            if os.path.exists(src_file):
-                shutil.copy2(src_file, dst_file)
-                print(f"Copied {src_file} to {dst_file}")
-            else:
-                print(f"Warning: {src_file} not found. Skipping.")
+    if not have_data or recorded is not None:
+        data_generator.generate_test_data(data_dir, **GENERATION_PARAMS)
+    with open(manifest_path, 'w') as f:
+        json.dump({"params": GENERATION_PARAMS}, f)
+
+def _copy_data_for(ai_dir, data_dir, log=print):
+    """Copy schemas and sample data into one AI competitor directory."""
+    # Create data subdirectory in the AI directory
+    ai_data_dir = os.path.join(ai_dir, "data")
+    os.makedirs(ai_data_dir, exist_ok=True)
+
+    # Copy schema and sample data files
+    for filename, src_file in _present_data_files(data_dir):
+        dst_file = os.path.join(ai_data_dir, filename)
+        _fast_copy(src_file, dst_file)
+        log(f"Copied {src_file} to {dst_file}")
 
 def copy_interfaces():
     """Copy interface definitions to each AI competitor directory."""
@@ -71,70 +349,88 @@ def copy_interfaces():
         return
 
     for ai_dir in AI_DIRS:
-        # Create interfaces subdirectory in each AI directory
-        ai_interfaces_dir = os.path.join(ai_dir, "interfaces")
-        os.makedirs(ai_interfaces_dir, exist_ok=True)
-
-        # Copy all files from interfaces directory
-        for filename in os.listdir("interfaces"):
-            if filename.endswith(".py"):
-                src_file = os.path.join("interfaces", filename)
-                dst_file = os.path.join(ai_interfaces_dir, filename)
-                shutil.copy2(src_file, dst_file)
-                print(f"Copied {src_file} to {dst_file}")
+        _copy_interfaces_for(ai_dir)
+
+def _copy_interfaces_for(ai_dir, log=print):
+    """Copy interface definitions into one AI competitor directory."""
+    ai_interfaces_dir = os.path.join(ai_dir, "interfaces")
+
+    # Mirror the interfaces tree. os.walk is scandir-backed, so entry types
+    # come from readdir without per-entry stats, and nested subpackages are
+    # picked up should interfaces/ ever grow them; __pycache__ is pruned
+    # in place so the walk never descends into it.
+    for root, dirs, files in os.walk("interfaces"):
+        if "__pycache__" in dirs:
+            dirs.remove("__pycache__")
+        rel = os.path.relpath(root, "interfaces")
+        dst_dir = (ai_interfaces_dir if rel == os.curdir
+                   else os.path.join(ai_interfaces_dir, rel))
+        os.makedirs(dst_dir, exist_ok=True)
+        for filename in files:
+            if not filename.endswith(".py"):
+                continue
+            src_file = os.path.join(root, filename)
+            dst_file = os.path.join(dst_dir, filename)
+            _fast_copy(src_file, dst_file)
+            log(f"Copied {src_file} to {dst_file}")
 
 def copy_documentation():
     """Copy README.md, ALGORITHM.md, and instructions_and_tips.md to each AI competitor directory."""
     for ai_dir in AI_DIRS:
-        for filename in ["README.md", "ALGORITHM.md", "instructions_and_tips.md"]:
-            if os.path.exists(filename):
-                dst_file = os.path.join(ai_dir, filename)
-                shutil.copy2(filename, dst_file)
-                print(f"Copied {filename} to {dst_file}")
-            else:
-                print(f"Warning: {filename} not found. Skipping.")
+        _copy_documentation_for(ai_dir)
+
+def _copy_documentation_for(ai_dir, log=print):
+    """Copy the documentation files into one AI competitor directory."""
+    for filename in _present_doc_files():
+        dst_file = os.path.join(ai_dir, filename)
+        _fast_copy(filename, dst_file)
+        log(f"Copied {filename} to {dst_file}")
 
 
 def copy_solution_templates():
     """Copy simplified solution templates to each AI competitor directory."""
     for ai_dir in AI_DIRS:
-        # Create solutions directory
-        solutions_dir = os.path.join(ai_dir, "solutions")
-        os.makedirs(solutions_dir, exist_ok=True)
-
-        # Copy solution README
-        solutions_readme = os.path.join(ai_dir, "solutions", "README.md")
-        if os.path.exists(solutions_readme):
-            print(f"Solutions README already exists at {solutions_readme}")
-        elif os.path.exists("solutions_template/README.md"):
-            shutil.copy2("solutions_template/README.md", solutions_readme)
-            print(f"Copied solutions README to {solutions_readme}")
-
-        # Copy minimal solution template files
-        for filename in ["wrangler.py", "alignment.py"]:
-            dst_file = os.path.join(solutions_dir, filename)
-            if os.path.exists(dst_file):
-                print(f"Solution file already exists at {dst_file}")
-            elif os.path.exists(f"solutions_template/{filename}"):
-                shutil.copy2(f"solutions_template/{filename}", dst_file)
-                print(f"Copied solution template {filename} to {dst_file}")
-            else:
-                # If template directory doesn't exist, copy from another competitor if available
-                for other_dir in AI_DIRS:
-                    if other_dir != ai_dir:
-                        src_file = os.path.join(other_dir, "solutions", filename)
-                        if os.path.exists(src_file):
-                            shutil.copy2(src_file, dst_file)
-                            print(f"Copied solution template {filename} from {other_dir} to {dst_file}")
-                            break
-
-        # Copy .ruff.toml configuration
-        ruff_config = os.path.join(ai_dir, ".ruff.toml")
-        if os.path.exists(ruff_config):
-            print(f"Ruff configuration already exists at {ruff_config}")
-        elif os.path.exists(".ruff.toml"):
-            shutil.copy2(".ruff.toml", ruff_config)
-            print(f"Copied .ruff.toml to {ruff_config}")
+        _copy_solution_templates_for(ai_dir)
+
+def _copy_solution_templates_for(ai_dir, log=print):
+    """Copy solution templates and tooling config into one AI competitor directory."""
+    # Create solutions directory
+    solutions_dir = os.path.join(ai_dir, "solutions")
+    os.makedirs(solutions_dir, exist_ok=True)
+
+    # Copy solution README
+    solutions_readme = os.path.join(ai_dir, "solutions", "README.md")
+    if os.path.exists(solutions_readme):
+        log(f"Solutions README already exists at {solutions_readme}")
+    elif os.path.exists("solutions_template/README.md"):
+        _private_copy("solutions_template/README.md", solutions_readme)
+        log(f"Copied solutions README to {solutions_readme}")
+
+    # Copy minimal solution template files
+    for filename in SOLUTION_FILES:
+        dst_file = os.path.join(solutions_dir, filename)
+        if os.path.exists(dst_file):
+            log(f"Solution file already exists at {dst_file}")
+        elif os.path.exists(f"solutions_template/{filename}"):
+            _private_copy(f"solutions_template/{filename}", dst_file)
+            log(f"Copied solution template {filename} to {dst_file}")
+        else:
+            # If template directory doesn't exist, copy from another competitor if available
+            for other_dir in AI_DIRS:
+                if other_dir != ai_dir:
+                    src_file = os.path.join(other_dir, "solutions", filename)
+                    if os.path.exists(src_file):
+                        _private_copy(src_file, dst_file)
+                        log(f"Copied solution template {filename} from {other_dir} to {dst_file}")
+                        break
+
+    # Copy .ruff.toml configuration
+    ruff_config = os.path.join(ai_dir, ".ruff.toml")
+    if os.path.exists(ruff_config):
+        log(f"Ruff configuration already exists at {ruff_config}")
+    elif os.path.exists(".ruff.toml"):
+        _private_copy(".ruff.toml", ruff_config)
+        log(f"Copied .ruff.toml to {ruff_config}")
 
 
 def copy_requirements():
@@ -144,64 +440,67 @@ def copy_requirements():
         return
 
     for ai_dir in AI_DIRS:
-        dst_file = os.path.join(ai_dir, "requirements.txt")
-        shutil.copy2("requirements.txt", dst_file)
-        print(f"Copied requirements.txt to {dst_file}")
+        _copy_requirements_for(ai_dir)
+
+def _copy_requirements_for(ai_dir, log=print):
+    """Copy requirements.txt into one AI competitor directory."""
+    if not os.path.exists("requirements.txt"):
+        log("Warning: requirements.txt not found. Skipping.")
+        return
+    dst_file = os.path.join(ai_dir, "requirements.txt")
+    _fast_copy("requirements.txt", dst_file)
+    log(f"Copied requirements.txt to {dst_file}")
 
 
 def copy_evaluation_scripts():
     """Copy evaluation scripts to each AI competitor directory."""
-    evaluation_scripts = [
-        "evaluate_wrangler.py",
-        "evaluate_alignment.py",
-        "evaluate_end_to_end.py"
-    ]
-
-    for script in evaluation_scripts:
-        if not os.path.exists(script):
-            print(f"Warning: {script} not found. Skipping.")
-            continue
-
-        for ai_dir in AI_DIRS:
-            dst_file = os.path.join(ai_dir, script)
-            shutil.copy2(script, dst_file)
-            print(f"Copied {script} to {dst_file}")
     for ai_dir in AI_DIRS:
-        # Create interfaces subdirectory in each AI directory
-        ai_interfaces_dir = os.path.join(ai_dir, "interfaces")
-        os.makedirs(ai_interfaces_dir, exist_ok=True)
-
-        # Copy all files from interfaces directory
-        for filename in os.listdir("interfaces"):
-            if filename.endswith(".py"):
-                src_file = os.path.join("interfaces", filename)
-                dst_file = os.path.join(ai_interfaces_dir, filename)
-                shutil.copy2(src_file, dst_file)
-                print(f"Copied {src_file} to {dst_file}")
+        _copy_evaluation_scripts_for(ai_dir)
 
-def copy_documentation():
-    """Copy README.md, ALGORITHM.md, and instructions_and_tips.md to each AI competitor directory."""
-    for ai_dir in AI_DIRS:
-        for filename in ["README.md", "ALGORITHM.md", "instructions_and_tips.md"]:
-            if os.path.exists(filename):
-                dst_file = os.path.join(ai_dir, filename)
-                shutil.copy2(filename, dst_file)
-                print(f"Copied {filename} to {dst_file}")
-            else:
-                print(f"Warning: {filename} not found. Skipping.")
+def _copy_evaluation_scripts_for(ai_dir, log=print):
+    """Copy the evaluation scripts into one AI competitor directory."""
+    for script in _present_evaluation_scripts():
+        dst_file = os.path.join(ai_dir, script)
+        _fast_copy(script, dst_file)
+        log(f"Copied {script} to {dst_file}")
+
+def _setup_one(ai_dir, data_dir):
+    """
+    Run every per-directory copy step for one AI competitor directory.
+
+    Progress messages are buffered and flushed as one stdout write at the
+    end, so the worker threads don't serialize on the stdout lock (and the
+    output stays grouped per directory).
+    """
+    messages = []
+    log = messages.append
+    _copy_data_for(ai_dir, data_dir, log)
+    _copy_interfaces_for(ai_dir, log)
+    _copy_documentation_for(ai_dir, log)
+    _copy_solution_templates_for(ai_dir, log)
+    _copy_requirements_for(ai_dir, log)
+    _copy_evaluation_scripts_for(ai_dir, log)
+    if messages:
+        sys.stdout.write("\n".join(messages) + "\n")
 
 def main():
     parser = argparse.ArgumentParser(description="Set up competition directories")
     parser.add_argument("--data-dir", default="data", help="Directory containing schemas and sample data")
     args = parser.parse_args()
 
-    create_directories()
-    copy_schemas_and_data(args.data_dir)
-    copy_interfaces()
-    copy_documentation()
-    copy_solution_templates()
-    copy_requirements()
-    copy_evaluation_scripts()
+    create_directories(args.data_dir)
+    _ensure_sample_data(args.data_dir)
+
+    # Each competitor directory is independent of the others, and the work is
+    # dominated by filesystem waits, so fan the per-directory setup out across
+    # a thread pool (one worker per directory).
+    with ThreadPoolExecutor(max_workers=len(AI_DIRS)) as executor:
+        list(executor.map(lambda ai_dir: _setup_one(ai_dir, args.data_dir), AI_DIRS))
+
+    # One flush for everything written above — far cheaper than a per-file
+    # fsync, and the atomic renames mean nothing is ever half-visible
+    if hasattr(os, 'sync'):
+        os.sync()
 
     print("Competition directories setup complete!")
 
@@ -5,7 +5,7 @@ This module implements the align_subtitles function for The Sync Showdown
 component of the subtitle alignment competition.
 """
 
-from typing import dict, Any, list, Optional, tuple
+from typing import Any, Optional
 
 
 class AlignmentResult: